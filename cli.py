@@ -8,15 +8,19 @@ cli.py – Interface em modo texto para o pacote de grafos
 """
 from __future__ import annotations
 
-import argparse
-import csv
+import functools
 import os
 import sys
-from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from itertools import takewhile
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 import csv_loader  # utilitário para ler CSVs da pasta ./files
-from graph import Edge, Graph, Vertex
+
+if TYPE_CHECKING:  # importados só nas funções que usam, após tratar argv
+    import argparse
+    from concurrent.futures import Future
+
+    from graph import Edge, Graph, Vertex
 
 # ======================================================================#
 #  Banner                                                               #
@@ -40,6 +44,67 @@ def print_banner() -> None:
     )
 
 
+# ======================================================================#
+#  Textos dos menus                                                     #
+# ======================================================================#
+# Constantes de módulo, escritas a cada volta dos laços com um único write()
+
+MAIN_MENU = """
+====================  MENU PRINCIPAL  ====================
+1  Carregar / recriar grafo
+2  Exibir representações
+3  Operações
+4  Ajuda / Tutorial
+5  Salvar PNG do grafo carregado
+0  Sair
+==========================================================
+
+"""
+
+LOAD_MENU = """
+=== Como deseja construir o grafo? ===
+  1. Inserir lista de arestas
+  2. Inserir matriz de adjacência
+  3. Inserir matriz de incidência
+  4. Carregar de CSV
+  h. Ajuda sobre formatos
+  0. Cancelar
+
+"""
+
+OPERATIONS_MENU = """
+--- OPERACOES ---
+1  |V|   – número de vértices
+2  |E|   – número de arestas
+3  Vizinhos de um vértice
+4  Existe aresta entre dois vértices
+5  Grau de um vértice
+6  Graus de todos os vértices
+7  Caminho simples entre dois vértices
+8  Ciclo contendo um vértice
+9  Verificar subgrafo
+10 União com outro grafo
+11 Intersecção com outro grafo
+12 Diferença simétrica com outro grafo
+13 Gerar grafo sem um vértice
+14 Gerar grafo sem uma aresta
+15 Fundir dois vértices
+16 Verificar se é Euleriano
+17 Procurar ciclo Hamiltoniano
+18 Verificar se é uma ÁRVORE
+19 Encontrar CENTRO(S) da árvore
+20 Calcular excentricidade dos vértices da árvore
+21 Determinar raio da árvore
+22 Distância ENTRE duas ÁRVORES do grafo
+23 Gerar ÁRVORE CENTRAL do grafo
+24 Gerar Árvore de Abrangência do grafo
+25 Verificar se A1 é uma árvore subgrafo de G
+26 Verificar se A1 é uma árvore de abrangência de G
+0  Voltar
+
+"""
+
+
 # ======================================================================#
 #  Ajuda / Tutorial                                                     #
 # ======================================================================#
@@ -97,49 +162,171 @@ Exemplos de entrada de grafos
     )
 
 
+# ======================================================================#
+#  Edição de linha (readline)                                           #
+# ======================================================================#
+
+
+def _stdin_is_interactive() -> bool:
+    """True quando a entrada vem de um terminal (e não de pipe/arquivo)."""
+    return sys.stdin.isatty()
+
+
+# Rótulos oferecidos pelo <Tab>; atualizados a cada grafo carregado
+_completion_words: List[str] = []
+
+
+def _complete(text: str, state: int) -> Optional[str]:
+    matches = [w for w in _completion_words if w.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+
+def setup_readline() -> None:
+    """Ativa histórico e completação de vértices nos prompts, se disponível."""
+    if not _stdin_is_interactive():
+        return
+    try:
+        import readline
+    except ImportError:  # Windows sem pyreadline, por exemplo
+        return
+    readline.parse_and_bind("tab: complete")
+    readline.set_history_length(1000)
+    readline.set_completer(_complete)
+
+
+def set_completion_vertices(g: Optional[Graph]) -> None:
+    """Cache ordenado dos rótulos de *g* para a completação por <Tab>."""
+    _completion_words[:] = sorted(g.V) if g else []
+
+
 # ======================================================================#
 #  Funções de prompt                                                    #
 # ======================================================================#
 
+# Respostas que exibem os exemplos de formato (comparadas já em minúsculas)
+_HELP = frozenset(("h", "help"))
+
+
+def _read_edges(lines: Iterable[str]) -> Set[Edge]:
+    """
+    Lê arestas *u v* de um fluxo não interativo (pipe ou arquivo) numa única
+    passada, sem prompts, até a primeira linha vazia ou EOF.
+
+    Os rótulos são internados (sys.intern): cada vértice repetido em várias
+    arestas passa a ser um único objeto str, com hash já calculado.
+    """
+    intern = sys.intern
+    edges: Set[Edge] = set()
+    rows = ([*map(intern, line.split())] for line in takewhile(str.strip, lines))
+    edges.update((u, v) if u <= v else (v, u) for u, v in (p for p in rows if len(p) == 2))
+    return edges
+
 
 def prompt_edges() -> Set[Edge]:
+    if not _stdin_is_interactive():
+        return _read_edges(sys.stdin)
+
     print("Digite as arestas (u v). Linha vazia encerra.  (h = ajuda)")
     edges: Set[Edge] = set()
+    edges_add, intern = edges.add, sys.intern
     while True:
         line = input("edge> ").strip()
         if not line:
             break
-        if line.lower() in {"h", "help"}:
+        if line.lower() in _HELP:
             print_format_examples()
             continue
         parts = line.split()
         if len(parts) != 2:
             print("Digite exatamente dois vértices.")
             continue
-        u, v = parts
-        edges.add((min(u, v), max(u, v)))
+        u, v = intern(parts[0]), intern(parts[1])
+        edges_add((u, v) if u <= v else (v, u))
     return edges
 
 
 def prompt_vertex(label: str = "vértice") -> Vertex:
-    return input(f"{label}> ").strip()
+    return sys.intern(input(f"{label}> ").strip())
+
+
+def prompt_labels(n: int) -> List[Vertex]:
+    """
+    Pede todos os rótulos numa única linha ("A B C ..."); Enter usa 1..n.
+    """
+    default = [str(i + 1) for i in range(n)]
+    while True:
+        bulk = input(f"Rótulos dos {n} vértices (Enter=1..{n}, ou 'A B C ...'): ").split()
+        if not bulk:
+            return default
+        if len(bulk) == n and len(set(bulk)) == n:
+            return [sys.intern(lbl) for lbl in bulk]
+        print(f"Informe exatamente {n} rótulos distintos.")
+
+
+# Únicos tokens aceitos numa linha de matriz
+_BINARY_TOKENS = frozenset(("0", "1"))
+
+
+def _parse_matrix_row(row_str: str, cols: int) -> List[int]:
+    """Converte uma linha "0 1 ..." em lista de int; ValueError se inválida.
+
+    A validação é feita uma única vez sobre os *tokens* (conjunto de strings
+    distintas da linha), sem converter nem testar célula a célula.
+    """
+    tokens = row_str.split()
+    if not _BINARY_TOKENS.issuperset(tokens):
+        raise ValueError("Use apenas 0 ou 1.")
+    if len(tokens) != cols:
+        raise ValueError(f"A linha deve ter {cols} valores 0/1.")
+    return [1 if t == "1" else 0 for t in tokens]
+
+
+def _read_matrix(lines: Iterable[str], rows: int, cols: int) -> List[List[int]]:
+    """
+    Lê uma matriz *rows*×*cols* de um fluxo não interativo, sem prompts.
+
+    Os valores são lidos como um único lote de tokens (quebras de linha não
+    importam), validados de uma vez por diferença de conjuntos e só então
+    fatiados em linhas. Consome apenas as linhas necessárias do fluxo.
+
+    Raises
+    ------
+    ValueError – valores fora de 0/1 ou sobrando na última linha lida.
+    EOFError   – se o fluxo terminar antes de completar a matriz.
+    """
+    need = rows * cols
+    if not need:
+        return [[] for _ in range(rows)]
+    tokens: List[str] = []
+    for line in lines:
+        tokens += line.split()
+        if len(tokens) >= need:
+            break
+    else:
+        raise EOFError("Entrada terminou antes de completar a matriz.")
+    if len(tokens) > need:
+        raise ValueError(f"Esperados {need} valores 0/1, encontrados {len(tokens)}.")
+    if set(tokens) - _BINARY_TOKENS:
+        raise ValueError("Use apenas 0 ou 1.")
+    bits = [1 if t == "1" else 0 for t in tokens]
+    return [bits[i : i + cols] for i in range(0, need, cols)]
 
 
 def prompt_matrix(rows: int, cols: int, kind: str) -> List[List[int]]:
+    if not _stdin_is_interactive():
+        return _read_matrix(sys.stdin, rows, cols)
+
     matrix: List[List[int]] = []
     for i in range(rows):
         while True:
             row_str = input(f"{kind} linha {i}> ").strip()
-            if row_str.lower() in {"h", "help"}:
+            if row_str.lower() in _HELP:
                 print_format_examples()
                 continue
             try:
-                row = list(map(int, row_str.split()))
-            except ValueError:
-                print("Use apenas 0 ou 1.")
-                continue
-            if len(row) != cols or any(x not in {0, 1} for x in row):
-                print(f"A linha deve ter {cols} valores 0/1.")
+                row = _parse_matrix_row(row_str, cols)
+            except ValueError as e:
+                print(e)
                 continue
             matrix.append(row)
             break
@@ -175,22 +362,84 @@ def choose_csv_file() -> Optional[str]:
         print("Número fora da lista.")
 
 
+# Leituras antecipadas (opção 4): (nome, mtime) → Future com o conteúdo já
+# parseado – matriz (List[List[int]]) ou lista de adjacência (Dict).
+_prefetched: Dict[Tuple[str, int], "Future"] = {}
+
+
+def _parse_csv_any(fname: str):
+    """Lê *fname* como matriz 0/1 ou, se não for matriz, como lista de adjacência."""
+    try:
+        return csv_loader.read_matrix(fname)
+    except ValueError:
+        return csv_loader.read_adj_list(fname)
+
+
+def prefetch_csv_files(limit: int = 8) -> None:
+    """
+    Dispara em segundo plano a leitura dos primeiros *limit* CSVs de ./files,
+    para que a escolha na opção 4 (e nas comparações A1/A2) já encontre o
+    arquivo lido enquanto o usuário ainda navega pelos menus.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    files = csv_loader.list_csv_files(limit)
+    if not files:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(files)))
+    for fname in files:
+        try:
+            mtime_ns = (csv_loader.BASE_DIR / fname).stat().st_mtime_ns
+        except OSError:
+            continue
+        _prefetched[(fname, mtime_ns)] = executor.submit(_parse_csv_any, fname)
+    executor.shutdown(wait=False)
+
+
+def _take_prefetched(fname: str, mtime_ns: int):
+    """Conteúdo antecipado de *fname* se ainda válido para *mtime_ns*, senão None."""
+    future = _prefetched.pop((fname, mtime_ns), None)
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception:  # o erro reaparece (com mensagem) na leitura normal
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_csv_graph(fname: str, mtime_ns: int, fmt: str) -> Graph:
+    """
+    Grafo construído a partir de files/*fname*, memorizado por
+    (nome, mtime, formato): carregar de novo o mesmo CSV na sessão (ex.: A1
+    nas opções 9/22/25) não repete parse nem construção.
+    """
+    from graph import Graph
+
+    data = _take_prefetched(fname, mtime_ns)
+    if fmt == "list":
+        L = data if isinstance(data, dict) else csv_loader.read_adj_list(fname)
+        return Graph.from_adjacency_list(L)
+    M = data if isinstance(data, list) else csv_loader.read_matrix(fname)
+    labels = [str(i+1) for i in range(len(M))]
+    if fmt == "adj":
+        return Graph.from_adjacency_matrix(M, labels)
+    return Graph.from_incidence_matrix(M, labels)
+
+
 def load_graph_from_csv() -> Optional[Graph]:
     fname = choose_csv_file()
     if not fname:
         return None
 
     fmt = input("Formato deste CSV (adj/inc/list): ").strip().lower()
-    try:
-        if fmt == "adj":
-            M = csv_loader.read_matrix(fname)
-            return Graph.from_adjacency_matrix(M, [str(i+1) for i in range(len(M))])
-        if fmt == "inc":
-            M = csv_loader.read_matrix(fname)
-            return Graph.from_incidence_matrix(M, [str(i+1) for i in range(len(M))])
-        if fmt == "list":
-            return Graph.from_adjacency_list(csv_loader.read_adj_list(fname))
+    if fmt not in {"adj", "inc", "list"}:
         print("Formato não reconhecido (use adj/inc/list).")
+        return None
+    try:
+        mtime_ns = (csv_loader.BASE_DIR / fname).stat().st_mtime_ns
+        # cópia: quem recebe o grafo pode alterá-lo sem corromper o cache
+        return _cached_csv_graph(fname, mtime_ns, fmt).copy()
     except Exception as e:
         print(f"Erro ao ler CSV: {e}")
     return None
@@ -202,23 +451,15 @@ def load_graph_from_csv() -> Optional[Graph]:
 
 
 def load_graph_menu() -> Optional[Graph]:
+    from graph import Graph
+
     while True:
-        print(
-            """
-=== Como deseja construir o grafo? ===
-  1. Inserir lista de arestas
-  2. Inserir matriz de adjacência
-  3. Inserir matriz de incidência
-  4. Carregar de CSV
-  h. Ajuda sobre formatos
-  0. Cancelar
-"""
-        )
+        sys.stdout.write(LOAD_MENU)
         choice = input("Escolha: ").strip().lower()
 
         if choice == "0":
             return None
-        if choice == "h":
+        if choice in _HELP:
             print_format_examples()
             continue
         if choice == "1":
@@ -229,8 +470,12 @@ def load_graph_menu() -> Optional[Graph]:
             except ValueError:
                 print("Digite um inteiro válido.")
                 continue
-            M = prompt_matrix(n, n, "matriz")
-            labels = [input(f"rótulo {i+1} (Enter={i+1}): ") or str(i) for i in range(n)]
+            try:
+                M = prompt_matrix(n, n, "matriz")
+            except ValueError as e:
+                print(f"Erro: {e}")
+                continue
+            labels = prompt_labels(n)
             return Graph.from_adjacency_matrix(M, labels)
         if choice == "3":
             try:
@@ -239,9 +484,9 @@ def load_graph_menu() -> Optional[Graph]:
             except ValueError:
                 print("Digite inteiros válidos.")
                 continue
-            M = prompt_matrix(n, m, "incidência")
-            labels = [input(f"rótulo {i+1} (Enter={i+1}): ") or str(i+1) for i in range(n)]
             try:
+                M = prompt_matrix(n, m, "incidência")
+                labels = prompt_labels(n)
                 return Graph.from_incidence_matrix(M, labels)
             except ValueError as e:
                 print(f"Erro: {e}")
@@ -255,247 +500,286 @@ def load_graph_menu() -> Optional[Graph]:
         print("Opção inválida!")
 
 
+# ======================================================================#
+#  Formatação de saída                                                  #
+# ======================================================================#
+
+
+def format_matrix(M: List[List[int]]) -> str:
+    """Monta a matriz inteira como um único bloco de texto (uma linha por fila)."""
+    return "".join(" ".join(map(str, row)) + "\n" for row in M)
+
+
+def format_adjacency(L: Dict[Vertex, List[Vertex]]) -> str:
+    """Monta a lista de adjacência como um único bloco "v: viz1, viz2"."""
+    return "".join(f"{v}: {', '.join(neigh)}\n" for v, neigh in L.items())
+
+
+def print_adjacency(g: Graph) -> None:
+    """Escreve a lista de adjacência de *g* linha a linha, à medida que é gerada."""
+    sys.stdout.writelines(f"{v}: {', '.join(neigh)}\n" for v, neigh in g.iter_adjacency())
+
+
 # ======================================================================#
 #  Submenu de operações                                                 #
 # ======================================================================#
 
 
 def _clear_screen() -> None:
-    """Limpa o terminal (Windows: cls, Unix: clear)."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """Limpa o terminal (Windows: cls, Unix: clear); nada faz fora de um TTY."""
+    if sys.stdout.isatty():
+        os.system("cls" if os.name == "nt" else "clear")
+
+
+class Query(NamedTuple):
+    """Consulta simples: pergunta os vértices, chama o método e imprime."""
+
+    prompts: Tuple[str, ...]  # rótulos passados a prompt_vertex, em ordem
+    method: str  # nome do método de Graph chamado com os vértices lidos
+    label: str  # prefixo impresso; pode referenciar os argumentos ({0}, {1})
+    fallback: Optional[str] = None  # impresso se o resultado for vazio/None
+
+
+# Transições fixas do submenu: opção → consulta (demais opções em operations_menu)
+QUERIES: Dict[str, Query] = {
+    "1": Query((), "num_vertices", "|V| ="),
+    "2": Query((), "num_edges", "|E| ="),
+    "3": Query(("vértice",), "neighbors", "Adjacentes:"),
+    "4": Query(("u", "v"), "are_adjacent", "Existe aresta?"),
+    "5": Query(("vértice",), "degree", "Grau({0}) ="),
+    "7": Query(("origem", "destino"), "simple_path", "Caminho:", "Nenhum caminho."),
+    "8": Query(("vértice",), "cycle_containing", "Ciclo:", "Nenhum ciclo."),
+}
+
+
+def run_simple_query(g: Graph, query: Query) -> None:
+    args = [prompt_vertex(lbl) for lbl in query.prompts]
+    try:
+        result = getattr(g, query.method)(*args)
+    except ValueError as e:
+        print(f"Erro: {e}")
+        return
+    if query.fallback is not None:
+        result = result or query.fallback
+    print(query.label.format(*args), result)
+
+
+def _print_result(res: Graph, title: str = "Grafo resultante") -> None:
+    print(f"{title} (lista de adjacência):")
+    print_adjacency(res)
+
+
+def _op_degrees(g: Graph) -> None:
+    for v, d in g.degrees().items():
+        print(f"{v}: grau {d}")
+
+
+def _op_subgraph(g: Graph) -> None:
+    print("Insira o grafo para comparar (subgrafo).")
+    other = load_graph_menu()
+    if other:
+        if other.is_subgraph_of(g):
+            print("O grafo inserido é SUBGRAFO de G.")
+        elif g.is_subgraph_of(other):
+            print("G é SUBGRAFO do grafo inserido.")
+        else:
+            print("Nenhum é subgrafo do outro.")
+
+
+def _binary_op(method: str, name: str) -> Callable[[Graph], None]:
+    """Operação entre G e um segundo grafo lido do usuário (opções 10–12)."""
+
+    def op(g: Graph) -> None:
+        print(f"Insira o segundo grafo para {name}.")
+        other = load_graph_menu()
+        if other:
+            _print_result(getattr(g, method)(other))
+
+    return op
+
+
+def _op_without_vertex(g: Graph) -> None:
+    v_del = prompt_vertex("vértice a remover")
+    try:
+        _print_result(g.without_vertex(v_del))
+    except ValueError as e:
+        print(e)
+
+
+def _op_without_edge(g: Graph) -> None:
+    u = prompt_vertex("u")
+    v = prompt_vertex("v")
+    try:
+        _print_result(g.without_edge(u, v))
+    except ValueError as e:
+        print(e)
+
+
+def _op_merge(g: Graph) -> None:
+    v1 = prompt_vertex("vértice 1")
+    v2 = prompt_vertex("vértice 2")
+    try:
+        _print_result(g.merge_vertices(v1, v2))
+    except ValueError as e:
+        print(e)
+
+
+def _yes_no(method: str, yes: str, no: str) -> Callable[[Graph], None]:
+    """Propriedade booleana de G (opções 17–18)."""
+
+    def op(g: Graph) -> None:
+        print(yes if getattr(g, method)() else no)
+
+    return op
+
+
+def _op_eulerian(g: Graph) -> None:
+    circuit = g.eulerian_circuit()
+    if circuit is None:
+        print("O grafo não é Euleriano.")
+    else:
+        print("O grafo é Euleriano.")
+        if circuit:
+            print("Circuito:", " → ".join(circuit))
+
+
+def _op_centers(g: Graph) -> None:
+    try:
+        centers = g.find_centers()
+        if len(centers) == 1:
+            print(f"O centro da árvore é: {centers[0]}")
+        else:
+            print(f"Os centros da árvore são: {', '.join(centers)}")
+    except ValueError as e:
+        print(f"Erro: {e}")
+
+
+def _op_eccentricities(g: Graph) -> None:
+    try:
+        ecc = g.vertex_eccentricities()
+        print("Excentricidade dos vértices:")
+        for v, e in sorted(ecc.items()):
+            print(f"{v}: {e}")
+    except ValueError as e:
+        print(f"Erro: {e}")
+
+
+def _op_radius(g: Graph) -> None:
+    try:
+        r = g.radius()
+        print(f"Raio da árvore: {r}")
+    except ValueError as e:
+        print(f"Erro: {e}")
+
+
+def _op_tree_distance(g: Graph) -> None:
+    print("Insira a PRIMEIRA árvore (A1).")
+    t1 = load_graph_menu()
+    if not t1 or not t1.is_tree():
+        print("A1 inválida ou não é árvore.")
+        return
+    print("Insira a SEGUNDA árvore (A2).")
+    t2 = load_graph_menu()
+    if not t2 or not t2.is_tree():
+        print("A2 inválida ou não é árvore.")
+        return
+    try:
+        dist = g.distance_between_trees(t1, t2)
+        if dist is None:
+            print("As árvores estão desconexas no grafo.")
+        else:
+            print(f"Distância mínima entre A1 e A2: {dist}")
+    except ValueError as e:
+        print(f"Erro: {e}")
+
+
+def _op_central_tree(g: Graph) -> None:
+    try:
+        _print_result(g.central_tree(), "Árvore central")
+    except ValueError as e:
+        print(f"Erro: {e}")
+
+
+def _op_spanning_trees(g: Graph) -> None:
+    try:
+        st = g.find_spanning_tree()
+        _print_result(st, "Árvore de Abrangência")
+        k = int(input("Insira quantas outras Árvores de Abrangência deseja encontrar(0 para sair): ").strip())
+        if k>0:
+            kst = g.k_spanning_trees(st, k)
+            for i,t in enumerate(kst):
+                print(f"Árvore de Abrangência {i+2}:")
+                print_adjacency(t)
+            if len(kst) < k:
+                print("Não há mais Árvores de Abrangência")
+    except ValueError as e:
+        print(f"Erro: {e}")
+
+
+def _op_subgraph_tree(g: Graph) -> None:
+    print("Insira a árvore A1 para verificar se é subgrafo de G.")
+    a1 = load_graph_menu()
+    if a1:
+        if g.is_subgraph_tree(a1):
+            print("Sim, A1 é uma árvore que é subgrafo de G.")
+        else:
+            print("Não, A1 não é uma árvore que é subgrafo de G.")
+
+
+def _op_spanning_tree_check(g: Graph) -> None:
+    print("Insira a árvore A1 para verificar se é uma árvore de abrangência de G.")
+    a1 = load_graph_menu()
+    if a1:
+        if g.is_spanning_tree(a1):
+            print("Sim, A1 é uma árvore de abrangência de G.")
+        else:
+            print("Não, A1 não é uma árvore de abrangência de G.")
+
+
+def _op_unknown(g: Graph) -> None:
+    print("Opção inválida!")
+
+
+# Tabela de despacho do submenu, montada uma vez no import: opção → handler
+_OPS: Dict[str, Callable[[Graph], None]] = {
+    **{op: functools.partial(run_simple_query, query=q) for op, q in QUERIES.items()},
+    "6": _op_degrees,
+    "9": _op_subgraph,
+    "10": _binary_op("union", "UNIÃO"),
+    "11": _binary_op("intersection", "INTERSECÇÃO"),
+    "12": _binary_op("symmetric_difference", "DIFERENÇA SIMÉTRICA"),
+    "13": _op_without_vertex,
+    "14": _op_without_edge,
+    "15": _op_merge,
+    "16": _op_eulerian,
+    "17": _yes_no(
+        "has_hamiltonian_cycle",
+        "O grafo tem um ciclo Hamiltoniano.",
+        "O grafo não tem um ciclo Hamiltoniano.",
+    ),
+    "18": _yes_no("is_tree", "Sim, o grafo é uma árvore.", "Não, o grafo não é uma árvore."),
+    "19": _op_centers,
+    "20": _op_eccentricities,
+    "21": _op_radius,
+    "22": _op_tree_distance,
+    "23": _op_central_tree,
+    "24": _op_spanning_trees,
+    "25": _op_subgraph_tree,
+    "26": _op_spanning_tree_check,
+}
 
 
 def operations_menu(g: Graph) -> None:
     while True:
         _clear_screen()
-        print(
-            """
---- OPERACOES ---
-1  |V|   – número de vértices
-2  |E|   – número de arestas
-3  Vizinhos de um vértice
-4  Existe aresta entre dois vértices
-5  Grau de um vértice
-6  Graus de todos os vértices
-7  Caminho simples entre dois vértices
-8  Ciclo contendo um vértice
-9  Verificar subgrafo
-10 União com outro grafo
-11 Intersecção com outro grafo
-12 Diferença simétrica com outro grafo
-13 Gerar grafo sem um vértice
-14 Gerar grafo sem uma aresta
-15 Fundir dois vértices
-16 Verificar se é Euleriano
-17 Procurar ciclo Hamiltoniano
-18 Verificar se é uma ÁRVORE
-19 Encontrar CENTRO(S) da árvore
-20 Calcular excentricidade dos vértices da árvore
-21 Determinar raio da árvore
-22 Distância ENTRE duas ÁRVORES do grafo
-23 Gerar ÁRVORE CENTRAL do grafo
-24 Gerar Árvore de Abrangência do grafo
-25 Verificar se A1 é uma árvore subgrafo de G
-26 Verificar se A1 é uma árvore de abrangência de G
-0  Voltar
-"""
-        )
+        sys.stdout.write(OPERATIONS_MENU)
         op = input("Escolha: ").strip()
-
         if op == "0":
             break
-        elif op == "1":
-            print("|V| =", g.num_vertices())
-        elif op == "2":
-            print("|E| =", g.num_edges())
-        elif op == "3":
-            v = prompt_vertex()
-            print("Adjacentes:", g.neighbors(v))
-        elif op == "4":
-            u = prompt_vertex("u")
-            v = prompt_vertex("v")
-            print("Existe aresta?", g.are_adjacent(u, v))
-        elif op == "5":
-            v = prompt_vertex()
-            print(f"Grau({v}) =", g.degree(v))
-        elif op == "6":
-            for v, d in g.degrees().items():
-                print(f"{v}: grau {d}")
-        elif op == "7":
-            u = prompt_vertex("origem")
-            v = prompt_vertex("destino")
-            print("Caminho:", g.simple_path(u, v) or "Nenhum caminho.")
-        elif op == "8":
-            v = prompt_vertex()
-            print("Ciclo:", g.cycle_containing(v) or "Nenhum ciclo.")
-        elif op == "9":
-            print("Insira o grafo para comparar (subgrafo).")
-            other = load_graph_menu()
-            if other:
-                if other.is_subgraph_of(g):
-                    print("O grafo inserido é SUBGRAFO de G.")
-                elif g.is_subgraph_of(other):
-                    print("G é SUBGRAFO do grafo inserido.")
-                else:
-                    print("Nenhum é subgrafo do outro.")
-        elif op == "10":
-            print("Insira o segundo grafo para UNIÃO.")
-            other = load_graph_menu()
-            if other:
-                res = g.union(other)
-                print("Grafo resultante (lista de adjacência):")
-                for vtx, neigh in res.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-        elif op == "11":
-            print("Insira o segundo grafo para INTERSECÇÃO.")
-            other = load_graph_menu()
-            if other:
-                res = g.intersection(other)
-                print("Grafo resultante (lista de adjacência):")
-                for vtx, neigh in res.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-        elif op == "12":
-            print("Insira o segundo grafo para DIFERENÇA SIMÉTRICA.")
-            other = load_graph_menu()
-            if other:
-                res = g.symmetric_difference(other)
-                print("Grafo resultante (lista de adjacência):")
-                for vtx, neigh in res.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-        elif op == "13":
-            v_del = prompt_vertex("vértice a remover")
-            try:
-                res = g.without_vertex(v_del)
-                print("Grafo resultante (lista de adjacência):")
-                for vtx, neigh in res.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-            except ValueError as e:
-                print(e)
-        elif op == "14":
-            u = prompt_vertex("u")
-            v = prompt_vertex("v")
-            try:
-                res = g.without_edge(u, v)
-                print("Grafo resultante (lista de adjacência):")
-                for vtx, neigh in res.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-            except ValueError as e:
-                print(e)
-        elif op == "15":
-            v1 = prompt_vertex("vértice 1")
-            v2 = prompt_vertex("vértice 2")
-            try:
-                res = g.merge_vertices(v1, v2)
-                print("Grafo resultante (lista de adjacência):")
-                for vtx, neigh in res.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-            except ValueError as e:
-                print(e)
-        elif op == "16":
-            if g.is_eulerian():
-                print("O grafo é Euleriano.")
-            else:
-                print("O grafo não é Euleriano.")
-        elif op == "17":
-            if g.has_hamiltonian_cycle():
-                print("O grafo tem um ciclo Hamiltoniano.")
-            else:
-                print("O grafo não tem um ciclo Hamiltoniano.")
-        elif op == "18":
-            if g.is_tree():
-                print("Sim, o grafo é uma árvore.")
-            else:
-                print("Não, o grafo não é uma árvore.")
-        elif op == "19":
-            try:
-                centers = g.find_centers()
-                if len(centers) == 1:
-                    print(f"O centro da árvore é: {centers[0]}")
-                else:
-                    print(f"Os centros da árvore são: {', '.join(centers)}")
-            except ValueError as e:
-                print(f"Erro: {e}")
-        elif op == "20":
-            try:
-                ecc = g.vertex_eccentricities()
-                print("Excentricidade dos vértices:")
-                for v, e in sorted(ecc.items()):
-                    print(f"{v}: {e}")
-            except ValueError as e:
-                print(f"Erro: {e}")
-        elif op == "21":
-            try:
-                r = g.radius()
-                print(f"Raio da árvore: {r}")
-            except ValueError as e:
-                print(f"Erro: {e}")
-        elif op == "22":
-            print("Insira a PRIMEIRA árvore (A1).")
-            t1 = load_graph_menu()
-            if not t1 or not t1.is_tree():
-                print("A1 inválida ou não é árvore.")
-                continue
-            print("Insira a SEGUNDA árvore (A2).")
-            t2 = load_graph_menu()
-            if not t2 or not t2.is_tree():
-                print("A2 inválida ou não é árvore.")
-                continue
-            try:
-                dist = g.distance_between_trees(t1, t2)
-                if dist is None:
-                    print("As árvores estão desconexas no grafo.")
-                else:
-                    print(f"Distância mínima entre A1 e A2: {dist}")
-            except ValueError as e:
-                print(f"Erro: {e}")
-        elif op == "23":
-            try:
-                ct = g.central_tree()
-                print("Árvore central (lista de adjacência):")
-                for vtx, neigh in ct.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-            except ValueError as e:
-                print(f"Erro: {e}")
-        elif op == "24":
-            try:
-                st = g.find_spanning_tree()
-                print("Árvore de Abrangência(lista de adjacência):")
-                for vtx, neigh in st.adjacency_list().items():
-                    print(f"{vtx}: {', '.join(neigh)}")
-                k = int(input("Insira quantas outras Árvores de Abrangência deseja encontrar(0 para sair): ").strip())
-                if k>0:
-                    kst = []
-                    kst = g.k_spanning_trees(st, k)
-                    for i,t in enumerate(kst):
-                        print(f"Árvore de Abrangência {i+2}:")
-                        for vtx, neigh in t.adjacency_list().items():
-                            print(f"{vtx}: {', '.join(neigh)}")
-                    if len(kst) < k:
-                        print("Não há mais Árvores de Abrangência")
-            except ValueError as e:
-                print(f"Erro: {e}")
-        elif op == "25":
-            print("Insira a árvore A1 para verificar se é subgrafo de G.")
-            a1 = load_graph_menu()
-            if a1:
-                if g.is_subgraph_tree(a1):
-                    print("Sim, A1 é uma árvore que é subgrafo de G.")
-                else:
-                    print("Não, A1 não é uma árvore que é subgrafo de G.")
-        elif op == "26":
-            print("Insira a árvore A1 para verificar se é uma árvore de abrangência de G.")
-            a1 = load_graph_menu()
-            if a1:
-                if g.is_spanning_tree(a1):
-                    print("Sim, A1 é uma árvore de abrangência de G.")
-                else:
-                    print("Não, A1 não é uma árvore de abrangência de G.")
-        else:
-            print("Opção inválida!")
-        print()  # separador
-        # Pausa antes de reexibir o menu (exceto quando a escolha foi voltar)
-        if op != "0":
-            input("\nPressione Enter para voltar ao menu...")
+        _OPS.get(op, _op_unknown)(g)
+        sys.stdout.write("\n")  # separador
+        # Pausa antes de reexibir o menu
+        input("\nPressione Enter para voltar ao menu...")
 
 
 # ======================================================================#
@@ -503,78 +787,197 @@ def operations_menu(g: Graph) -> None:
 # ======================================================================#
 
 
+class _MainMenu:
+    """Estado do menu principal e um handler por opção (tabela de despacho)."""
+
+    def __init__(self) -> None:
+        self.graph: Optional[Graph] = None
+        # Representações já formatadas do grafo atual (opção 2); o CLI nunca
+        # modifica *graph* no lugar, então basta invalidar ao recarregar.
+        self.dump_cache: Optional[str] = None
+        self.running = True
+        # Opções que dispensam grafo carregado / que exigem um
+        self.free = {"0": self.quit, "1": self.load, "4": self.help, "5": self.save_png}
+        self.needs_graph = {"2": self.show, "3": self.operations}
+
+    def dispatch(self, cmd: str) -> None:
+        handler = self.free.get(cmd)
+        if handler:
+            handler()
+            return
+        if self.graph is None:
+            print("Nenhum grafo carregado. Use a opção 1 primeiro.")
+            return
+        handler = self.needs_graph.get(cmd)
+        if handler:
+            handler()
+        else:
+            print("Comando desconhecido!")
+        sys.stdout.write("\n")
+
+    # --- handlers -------------------------------------------------------
+    def quit(self) -> None:
+        print("Até logo!")
+        self.running = False
+
+    def help(self) -> None:
+        print_help()
+        input("\nPressione Enter para voltar ao menu...")
+
+    def load(self) -> None:
+        self.graph = load_graph_menu()
+        self.dump_cache = None
+        set_completion_vertices(self.graph)
+        if self.graph:
+            print("Grafo carregado com sucesso!")
+            input("\nPressione Enter para voltar ao menu...")
+
+    def save_png(self) -> None:
+        if self.graph is None:
+            print("Nenhum grafo carregado. Use a opção 1 primeiro.")
+            input("\nPressione Enter para voltar ao menu...")
+            return
+        fname = input("Nome do arquivo PNG (Enter=grafo.png): ").strip() or "grafo.png"
+        try:
+            self.graph.draw(fname)
+            print(f"Imagem salva em {fname}")
+        except ImportError:
+            print("Instale 'networkx' e 'matplotlib' (pip install networkx matplotlib) para gerar imagens.")
+        except Exception as e:
+            print(f"Erro ao gerar imagem: {e}")
+        input("\nPressione Enter para voltar ao menu...")
+
+    def show(self) -> None:
+        g = self.graph
+        if self.dump_cache is None:
+            self.dump_cache = (
+                "\n--- Matriz de adjacência ---\n"
+                + format_matrix(g.adjacency_matrix())
+                + "\n--- Matriz de incidência ---\n"
+                + format_matrix(g.incidence_matrix())
+                + "\n--- Lista de adjacência ---\n"
+                + format_adjacency(g.adjacency_list())
+            )
+        sys.stdout.write(self.dump_cache)
+        sys.stdout.flush()
+        input("\nPressione Enter para voltar ao menu...")
+
+    def operations(self) -> None:
+        operations_menu(self.graph)
+
+
+def _block_buffer_stdout() -> None:
+    """
+    Desliga o *line buffering* do stdout: cada print deixa de gerar um write().
+    Os menus sempre terminam num input(), que já descarrega o stdout antes de
+    ler, então nada fica retido na tela.
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False)
+
+
 def interactive_menu() -> None:
-    graph: Optional[Graph] = None
+    menu = _MainMenu()
+    setup_readline()
+    prefetch_csv_files()
+    _block_buffer_stdout()
 
-    while True:
+    while menu.running:
         _clear_screen()
         print_banner()
-        print(
-            """
-====================  MENU PRINCIPAL  ====================
-1  Carregar / recriar grafo
-2  Exibir representações
-3  Operações
-4  Ajuda / Tutorial
-5  Salvar PNG do grafo carregado
-0  Sair
-==========================================================
-"""
-        )
-        cmd = input("Escolha uma opção: ").strip()
+        sys.stdout.write(MAIN_MENU)
+        menu.dispatch(input("Escolha uma opção: ").strip())
 
-        if cmd == "0":
-            print("Até logo!")
-            break
-        elif cmd == "4":
-            print_help()
-            input("\nPressione Enter para voltar ao menu...")
-            continue
-        elif cmd == "1":
-            graph = load_graph_menu()
-            if graph:
-                print("Grafo carregado com sucesso!")
-                input("\nPressione Enter para voltar ao menu...")
-            continue
-        elif cmd == "5":
-            if graph is None:
-                print("Nenhum grafo carregado. Use a opção 1 primeiro.")
-                input("\nPressione Enter para voltar ao menu...")
-                continue
-            fname = input("Nome do arquivo PNG (Enter=grafo.png): ").strip() or "grafo.png"
-            try:
-                graph.draw(fname)
-                print(f"Imagem salva em {fname}")
-            except ImportError:
-                print("Instale 'networkx' e 'matplotlib' (pip install networkx matplotlib) para gerar imagens.")
-            except Exception as e:
-                print(f"Erro ao gerar imagem: {e}")
-            input("\nPressione Enter para voltar ao menu...")
-            continue
-        elif graph is None:
-            print("Nenhum grafo carregado. Use a opção 1 primeiro.")
-            continue
 
-        # --- Exibir representações ------------------------------------
-        if cmd == "2":
-            print("\n--- Matriz de adjacência ---")
-            for r in graph.adjacency_matrix():
-                print(" ".join(map(str, r)))
-            print("\n--- Matriz de incidência ---")
-            for r in graph.incidence_matrix():
-                print(" ".join(map(str, r)))
-            print("\n--- Lista de adjacência ---")
-            for v, neigh in graph.adjacency_list().items():
-                print(f"{v}: {', '.join(neigh)}")
-            input("\nPressione Enter para voltar ao menu...")
+def run_script(script: str) -> None:
+    """
+    Reexecuta o menu com as respostas de *script* (separadas por vírgula)
+    no lugar da entrada padrão; uma resposta vazia equivale a Enter.
+    """
+    import io
+
+    sys.stdin = io.StringIO("\n".join(script.split(",")) + "\n")
+    try:
+        interactive_menu()
+    finally:
+        sys.stdin = sys.__stdin__
+
+
+# ======================================================================#
+#  Modo não interativo (--edges / --adj / --inc)                        #
+# ======================================================================#
 
-        # --- Operações -------------------------------------------------
-        elif cmd == "3":
-            operations_menu(graph)
 
+def _data_lines(path: str) -> List[str]:
+    """Linhas não vazias de *path*, aceitando espaço, vírgula ou ponto-e-vírgula."""
+    with open(path, newline="") as fh:
+        return [
+            line.replace(",", " ").replace(";", " ")
+            for line in fh
+            if line.strip()
+        ]
+
+
+def _iter_edge_file(path: str) -> Iterator[Edge]:
+    """
+    Percorre as arestas de *path* sem carregar o arquivo inteiro como texto:
+    o arquivo é mapeado em memória (mmap) e cada linha "u v" é casada por
+    regex direto nos bytes; só os dois rótulos de cada linha são decodificados.
+    Linhas com número de campos diferente de dois são ignoradas.
+    """
+    import mmap
+    import re
+
+    intern = sys.intern
+
+    edge_line = re.compile(rb"^[ \t]*([^\s,;]+)[ \t,;]+([^\s,;]+)[ \t,;]*\r?$", re.M)
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:  # mmap não aceita arquivo vazio
+            return
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for m in edge_line.finditer(mm):
+                u, v = intern(m[1].decode()), intern(m[2].decode())
+                yield (u, v) if u <= v else (v, u)
+
+
+def _load_matrix_file(path: str) -> List[List[int]]:
+    lines = _data_lines(path)
+    if not lines:
+        raise ValueError(f"Arquivo '{path}' está vazio.")
+    cols = len(lines[0].split())
+    return [_parse_matrix_row(line, cols) for line in lines]
+
+
+def load_graph_from_args(args: argparse.Namespace) -> Graph:
+    """Constrói o grafo a partir do arquivo indicado em --edges, --adj ou --inc."""
+    from graph import Graph
+
+    if args.edges:
+        return Graph(edges=_iter_edge_file(args.edges))
+    M = _load_matrix_file(args.adj or args.inc)
+    labels = [str(i + 1) for i in range(len(M))]
+    if args.adj:
+        return Graph.from_adjacency_matrix(M, labels)
+    return Graph.from_incidence_matrix(M, labels)
+
+
+def run_query(args: argparse.Namespace) -> None:
+    """Carrega o grafo, responde a uma única consulta e sai (sem prompts)."""
+    try:
+        g = load_graph_from_args(args)
+        if args.query == "path":
+            print("Caminho:", g.simple_path(args.u, args.v) or "Nenhum caminho.")
+        elif args.query == "cycle":
+            print("Ciclo:", g.cycle_containing(args.u) or "Nenhum ciclo.")
+        elif args.query == "neighbors":
+            print("Adjacentes:", g.neighbors(args.u))
         else:
-            print("Comando desconhecido!")
-        print()
+            print_adjacency(g)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Erro: {e}")
 
 
 # ======================================================================#
@@ -583,6 +986,8 @@ def interactive_menu() -> None:
 
 
 def run_tests() -> None:
+    from graph import Graph
+
     print("Rodando smoke tests...")
 
     # Grafo quadrado A-B-D-C
@@ -605,36 +1010,129 @@ def run_tests() -> None:
     )
 
     # CSV round-trip (lista de adjacência)
-    import tempfile
-
-    tmp = tempfile.NamedTemporaryFile(
-        delete=False, suffix=".csv", mode="w", newline=""
-    )
-    writer = csv.writer(tmp)
-    for v, neigh in base.adjacency_list().items():
-        writer.writerow([v] + neigh)
-    tmp.close()
-    g_csv = Graph.from_adjacency_list(csv_loader.read_adj_list(Path(tmp.name).name))
-    os.unlink(tmp.name)
+    # (em memória: read_adj_list só aceita arquivos dentro de ./files)
+    import csv
+    import io
+
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerows([v] + neigh for v, neigh in base.adjacency_list().items())
+    buf.seek(0)
+    g_csv = Graph.from_adjacency_list(csv_loader._parse_adj_list(buf))
     assert g_csv.E == base.E
 
     print("🎉  Smoke tests OK!")
 
 
+def run_bench(n: int, seed: int = 0) -> None:
+    """
+    Mede o tempo das rotinas principais num grafo aleatório G(n, p)
+    (Erdős–Rényi) com grau médio ≈ 8. Determinístico para um mesmo *seed*.
+    """
+    import random
+    import time
+
+    from graph import Graph
+
+    if n < 2:
+        sys.exit("--bench requer N >= 2.")
+
+    rng = random.Random(seed)
+    p = min(1.0, 8 / n)
+    labels = [str(i) for i in range(n)]
+
+    def timed(label: str, fn):
+        t0 = time.perf_counter_ns()
+        result = fn()
+        dt = (time.perf_counter_ns() - t0) / 1e6
+        print(f"{label:<22} {dt:10.2f} ms")
+        return result
+
+    print(f"Benchmark: G(n={n}, p={p:.4f}), seed={seed}")
+    g = timed(
+        "construção",
+        lambda: Graph(
+            vertices=set(labels),
+            edges={
+                (labels[i], labels[j])
+                for i in range(n)
+                for j in range(i + 1, n)
+                if rng.random() < p
+            },
+        ),
+    )
+    print(f"|V| = {g.num_vertices()}, |E| = {g.num_edges()}")
+    timed("adjacency_matrix", g.adjacency_matrix)
+    timed("incidence_matrix", g.incidence_matrix)
+    timed("simple_path", lambda: g.simple_path(labels[0], labels[-1]))
+
+
 # ======================================================================#
 #  Entry-point                                                          #
 # ======================================================================#
 
 
-def main() -> None:
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    """Caminho completo (argparse) – usado para tudo além de "sem args" e --test."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="CLI de grafos.")
     parser.add_argument(
         "-t", "--test", action="store_true", help="Executa testes rápidos e sai."
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--bench",
+        type=int,
+        metavar="N",
+        help="Mede o tempo das rotinas principais num grafo aleatório de N vértices.",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--edges", metavar="ARQ", help="Lista de arestas (u v por linha).")
+    source.add_argument("--adj", metavar="ARQ", help="Matriz de adjacência 0/1.")
+    source.add_argument("--inc", metavar="ARQ", help="Matriz de incidência 0/1.")
+    parser.add_argument(
+        "--query",
+        choices=("path", "cycle", "neighbors"),
+        help="Consulta a responder sobre o grafo carregado (padrão: lista de adjacência).",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="CMDS",
+        help="Respostas do menu separadas por vírgula, ex.: \"1,1,A B,B C,,,2,,0\".",
+    )
+    parser.add_argument("--u", help="Vértice de origem / consultado.")
+    parser.add_argument("--v", help="Vértice de destino (para --query path).")
+    args = parser.parse_args(argv)
+
+    loaded = args.edges or args.adj or args.inc
+    if args.query and not loaded:
+        parser.error("--query requer --edges, --adj ou --inc.")
+    if args.query and args.u is None:
+        parser.error(f"--query {args.query} requer --u.")
+    if args.query == "path" and args.v is None:
+        parser.error("--query path requer --v.")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
 
+    # Atalhos para as invocações mais comuns, sem construir o ArgumentParser
+    if not argv:
+        interactive_menu()
+        return
+    if argv == ["-t"] or argv == ["--test"]:
+        run_tests()
+        return
+
+    args = _parse_args(argv)
     if args.test:
         run_tests()
+    elif args.bench is not None:
+        run_bench(args.bench)
+    elif args.edges or args.adj or args.inc:
+        run_query(args)
+    elif args.script is not None:
+        run_script(args.script)
     else:
         interactive_menu()
 
@@ -644,3 +1142,5 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         sys.exit("\nInterrompido pelo usuário.")
+    except EOFError:  # fim de pipe / --script sem "0" final
+        print()
@@ -18,10 +18,15 @@ assume que a primeira coluna é o vértice e as demais, seus vizinhos.
 
 from __future__ import annotations
 
-import csv
+import functools
+import heapq
+import mmap
 import os
+import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Set
+
+__all__ = ["list_csv_files", "read_matrix", "read_adj_list"]
 
 # --------------------------------------------------------------------- #
 #  Configuração da pasta base                                           #
@@ -38,7 +43,8 @@ def _safe_path(name: str) -> Path:
     Constrói caminho seguro dentro de ./files e impede *path traversal*.
     """
     p = (BASE_DIR / name).resolve()
-    if not str(p).startswith(str(BASE_DIR)):
+    # por componentes: "files_evil/x" não passa por ter "files" como prefixo
+    if not p.is_relative_to(BASE_DIR):
         raise ValueError("Acesso a caminhos fora da pasta 'files' não permitido.")
     if not p.is_file():
         raise FileNotFoundError(f"Arquivo '{name}' não encontrado em 'files/'.")
@@ -53,16 +59,24 @@ def list_csv_files(limit: int = 15) -> List[str]:
     Retorna até *limit* nomes de arquivos .csv presentes em ./files,
     ordenados alfabeticamente.
     """
-    return sorted(f.name for f in BASE_DIR.glob("*.csv"))[:limit]
+    # heap limitado a *limit* itens: O(N log limit), sem ordenar a pasta inteira
+    with os.scandir(BASE_DIR) as it:
+        names = (e.name for e in it if e.name.endswith(".csv") and e.is_file())
+        return heapq.nsmallest(limit, names)
 
 
 def _detect_delimiter(sample: str) -> str:
     """Tenta descobrir delimitador entre vírgula e ponto-e-vírgula.
 
+    0. Sem nenhum ';' na amostra, a resposta só pode ser vírgula (sem Sniffer).
     1. Usa csv.Sniffer se possível.
     2. Caso falhe (ValueError), decide com base em qual caractere aparece mais.
     3. Fallback final = vírgula.
     """
+    if ";" not in sample:
+        return ","
+    import csv  # só o Sniffer precisa do módulo; CSVs com vírgula nem o carregam
+
     try:
         dialect = csv.Sniffer().sniff(sample, delimiters=",;")
         return dialect.delimiter
@@ -75,6 +89,75 @@ def _detect_delimiter(sample: str) -> str:
         return ","
 
 
+@functools.lru_cache(maxsize=64)
+def _delimiter_for(path: str, mtime_ns: int) -> str:
+    """
+    Delimitador de *path*, memorizado por (caminho, mtime): reler o mesmo
+    arquivo na sessão não repete o *sniffing*; editá-lo invalida a entrada.
+    """
+    with open(path, newline="") as fh:
+        return _detect_delimiter(fh.read(1024))
+
+
+def _file_delimiter(path: Path) -> str:
+    return _delimiter_for(str(path), path.stat().st_mtime_ns)
+
+
+# bytes.translate: b"0" → 0x00, b"1" → 0x01 (list(bytes) já devolve os ints)
+_BIT_TABLE = bytes.maketrans(b"01", b"\x00\x01")
+_BLANKS = b" \t\r\n"
+
+
+def _scan_bit_rows(path: Path, delim: bytes) -> Optional[List[List[int]]]:
+    """
+    Caminho rápido para o formato usual "0,1,0": o arquivo é mapeado em
+    memória e cada linha é validada e convertida só com operações de *bytes*
+    (translate / strip / fatiamento), sem objeto str por célula.
+
+    Retorna None se alguma linha fugir do formato estrito (célula de mais de
+    um caractere, valor fora de 0/1, delimitador duplicado...): o chamador
+    recorre então ao parser textual, que produz as mensagens de erro.
+    """
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:  # mmap não aceita arquivo vazio
+            return []
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rows: List[List[int]] = []
+            for line in iter(mm.readline, b""):
+                clean = line.translate(None, _BLANKS).strip(delim)
+                if not clean:  # ignora linhas vazias
+                    continue
+                digits, seps = clean[0::2], clean[1::2]
+                if len(digits) != len(seps) + 1 or digits.strip(b"01") or seps.strip(delim):
+                    return None
+                rows.append(list(digits.translate(_BIT_TABLE)))
+            return rows
+
+
+_ZERO_ONE = frozenset(("0", "1"))
+_PARSE = {"0": 0, "1": 1}  # consulta no dict em vez de int(cell)
+
+
+def _parse_matrix_text(text: str, delim: str, name: str) -> List[List[int]]:
+    """Parser textual genérico (células com espaços, vazias, etc.)."""
+    # Células como texto; a validação 0/1 é feita uma única vez, sobre o
+    # conjunto de valores distintos do arquivo inteiro (e não célula a célula).
+    rows: List[List[str]] = []
+    distinct: Set[str] = set()
+    for line in text.splitlines():
+        cells = [c for c in (cell.strip() for cell in line.split(delim)) if c]
+        if not cells:  # ignora linhas vazias
+            continue
+        distinct.update(cells)
+        rows.append(cells)
+
+    if not distinct <= _ZERO_ONE:
+        bad = next(c for r in rows for c in r if c not in _ZERO_ONE)
+        raise ValueError(f"Valor inválido '{bad}' em {name}; use apenas 0 ou 1.")
+    parse = _PARSE.__getitem__
+    return [list(map(parse, r)) for r in rows]
+
+
 def read_matrix(name: str) -> List[List[int]]:
     """
     Lê *name* (CSV) como matriz de 0/1. Aceita vírgula ou ponto-e-vírgula.
@@ -86,24 +169,10 @@ def read_matrix(name: str) -> List[List[int]]:
                  diferentes.
     """
     path = _safe_path(name)
-    with path.open(newline="") as fh:
-        sample = fh.read(1024)
-        fh.seek(0)
-        delim = _detect_delimiter(sample)
-        reader = csv.reader(fh, delimiter=delim)
-        matrix: List[List[int]] = []
-        for row in reader:
-            if not row:  # ignora linhas vazias
-                continue
-            values = [cell.strip() for cell in row if cell.strip() != ""]
-            ints: List[int] = []
-            for cell in values:
-                if cell not in {"0", "1"}:
-                    raise ValueError(
-                        f"Valor inválido '{cell}' em {name}; use apenas 0 ou 1."
-                    )
-                ints.append(int(cell))
-            matrix.append(ints)
+    delim = _file_delimiter(path)
+    matrix = _scan_bit_rows(path, delim.encode())
+    if matrix is None:
+        matrix = _parse_matrix_text(path.read_text(), delim, name)
 
     # verificação de retangularidade
     if not matrix:
@@ -114,6 +183,29 @@ def read_matrix(name: str) -> List[List[int]]:
     return matrix
 
 
+def _parse_adj_list(fh: Iterable[str], delim: str = ",", name: str = "<stream>") -> Dict[str, List[str]]:
+    """
+    Interpreta as linhas de *fh* (arquivo aberto, io.StringIO, ...) como
+    lista de adjacência; *name* só aparece nas mensagens de erro.
+    """
+    adj: Dict[str, List[str]] = {}
+    # Rótulos internados (sys.intern): o mesmo vértice, em qualquer linha ou
+    # arquivo, vira um único objeto str e as comparações entre grafos
+    # carregados separadamente (E ⊆ E', interseção) param na identidade.
+    intern = sys.intern
+    # Gramática só de delimitadores (sem aspas): str.split dispensa o csv.reader
+    for line in fh:
+        cells = [intern(c) for c in (cell.strip() for cell in line.split(delim)) if c]
+        if not cells:
+            continue
+        v, *neigh = cells
+        if v in adj:
+            raise ValueError(f"Vértice '{v}' aparece mais de uma vez em {name}.")
+        # remove vizinhos duplicados mantendo ordem
+        adj[v] = list(dict.fromkeys(neigh))
+    return adj
+
+
 def read_adj_list(name: str) -> Dict[str, List[str]]:
     """
     Lê *name* (CSV) como lista de adjacência.
@@ -122,25 +214,6 @@ def read_adj_list(name: str) -> Dict[str, List[str]]:
     Retorna dict {vertex: [neighbors]}.
     """
     path = _safe_path(name)
+    delim = _file_delimiter(path)
     with path.open(newline="") as fh:
-        sample = fh.read(1024)
-        fh.seek(0)
-        delim = _detect_delimiter(sample)
-        reader = csv.reader(fh, delimiter=delim)
-        adj: Dict[str, List[str]] = {}
-        for row in reader:
-            if not row:
-                continue
-            cells = [c.strip() for c in row if c.strip() != ""]
-            v, *neigh = cells
-            if v in adj:
-                raise ValueError(f"Vértice '{v}' aparece mais de uma vez em {name}.")
-            # remove vizinhos duplicados mantendo ordem
-            unique = []
-            seen = set()
-            for n in neigh:
-                if n not in seen:
-                    unique.append(n)
-                    seen.add(n)
-            adj[v] = unique
-    return adj
\ No newline at end of file
+        return _parse_adj_list(fh, delim, name)
@@ -10,7 +10,8 @@ simétrica, além de verificar propriedades Eulerianas e Hamiltonianas.
 """
 from __future__ import annotations
 
-from textwrap import indent
+import io
+import sys
 
 from graph import Graph
 
@@ -63,20 +64,27 @@ ASCII_G2 = r"""
            H
 """
 
+# Todo o relatório é montado em memória e escrito de uma vez ao final
+out = io.StringIO()
+
+
+def adjacency_block(g: Graph, prefix: str = "  ") -> str:
+    return "".join(f"{prefix}{v}: {', '.join(neigh)}\n" for v, neigh in g.adjacency_list().items())
+
+
 def print_graph(title: str, g: Graph, ascii_art: str | None = None) -> None:
-    print(f"\n=== {title} ===")
+    out.write(f"\n=== {title} ===\n")
     if ascii_art:
-        print(ascii_art)
-    print(f"|V| = {g.num_vertices()}, |E| = {g.num_edges()}")
-    print("Lista de adjacência:")
-    for v, neigh in g.adjacency_list().items():
-        print(f"  {v}: {', '.join(neigh)}")
+        out.write(f"{ascii_art}\n")
+    out.write(f"|V| = {g.num_vertices()}, |E| = {g.num_edges()}\n")
+    out.write("Lista de adjacência:\n")
+    out.write(adjacency_block(g))
 
 
 def print_result(title: str, g: Graph) -> None:
-    print(f"\n--- {title} ---")
-    print(f"|V| = {g.num_vertices()}, |E| = {g.num_edges()}")
-    print(indent("\n".join(f"{v}: {', '.join(neigh)}" for v, neigh in g.adjacency_list().items()), "  "))
+    out.write(f"\n--- {title} ---\n")
+    out.write(f"|V| = {g.num_vertices()}, |E| = {g.num_edges()}\n")
+    out.write(adjacency_block(g) or "\n")  # grafo vazio: linha em branco
 
 
 # ---------------------------------------------------------------------
@@ -89,9 +97,9 @@ print_graph("G₂", G2, ASCII_G2)
 #  Propriedades individuais                                             
 # ---------------------------------------------------------------------
 for name, g in [("G₁", G1), ("G₂", G2)]:
-    print(f"\nPropriedades de {name}:")
-    print("  Euleriano :", "SIM" if g.is_eulerian() else "não")
-    print("  Hamilton. :", "SIM" if g.has_hamiltonian_cycle() else "não")
+    out.write(f"\nPropriedades de {name}:\n")
+    out.write(f"  Euleriano : {'SIM' if g.is_eulerian() else 'não'}\n")
+    out.write(f"  Hamilton. : {'SIM' if g.has_hamiltonian_cycle() else 'não'}\n")
 
 # ---------------------------------------------------------------------
 #  Operações entre G₁ e G₂                                              
@@ -104,4 +112,5 @@ print_result("União  G₁ ∪ G₂", Gu)
 print_result("Intersecção  G₁ ∩ G₂", Gi)
 print_result("Diferença simétrica  G₁ △ G₂", Gd)
 
-print("\nFIM da demonstração.") 
\ No newline at end of file
+out.write("\nFIM da demonstração.\n")
+sys.stdout.write(out.getvalue())
\ No newline at end of file
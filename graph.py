@@ -7,15 +7,24 @@ Implementa, **do zero**, todas as rotinas exigidas nos Exercícios 1 & 2
 da Série 3 (Introdução à Teoria de Grafos).  Nenhuma biblioteca externa
 de grafos é usada.
 
+Python puro, sem dependências nem etapa de compilação (JIT/AOT): as
+travessias rodam sobre um índice inteiro em CSR (Graph._csr), montado sob
+demanda e memorizado até a próxima mutação do grafo.
+
 Exporta:
     • Vertex – alias para str
-    • Edge   – Tuple[Vertex, Vertex]
+    • Edge   – Tuple[Vertex, Vertex], sempre na forma canônica (u <= v)
     • Graph  – classe principal
 """
 from __future__ import annotations
 
-import copy
-from typing import Dict, List, Optional, Set, Tuple
+import functools
+import sys
+from array import array
+from collections import deque
+from itertools import chain, compress
+from operator import and_, itemgetter, or_, sub
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 __all__ = ["Vertex", "Edge", "Graph"]
 
@@ -23,6 +32,476 @@ Vertex = str
 Edge = Tuple[Vertex, Vertex]
 
 
+class _CSR(NamedTuple):
+    """Índice inteiro do grafo em CSR (*compressed sparse row*), estrutura de
+    arrays: os vizinhos do vértice i são indices[indptr[i]:indptr[i + 1]]."""
+
+    labels: List[Vertex]  # id → rótulo (ordem de inserção em adj)
+    idx: Dict[Vertex, int]  # rótulo → id
+    indptr: "array[int]"  # n + 1 deslocamentos em indices
+    indices: "array[int]"  # 2·|E| ids de vizinhos, na ordem de adj[v]
+
+
+def _cached_on_epoch(copy_result: Optional[Callable[[Any], Any]] = None):
+    """
+    Memoriza um método sem argumentos de Graph enquanto o grafo não muda:
+    o valor fica em self._memo junto do _epoch em que foi calculado.
+    *copy_result* (se dado) entrega ao chamador uma cópia rasa, para que o
+    resultado devolvido possa ser alterado sem corromper o cache.
+    """
+
+    def decorator(method):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self):
+            hit = self._memo.get(name)
+            if hit is None or hit[0] != self._epoch:
+                hit = self._memo[name] = (self._epoch, method(self))
+            return copy_result(hit[1]) if copy_result else hit[1]
+
+        return wrapper
+
+    return decorator
+
+
+def _copy_lists(L: Dict[Vertex, List[Vertex]]) -> Dict[Vertex, List[Vertex]]:
+    return {v: neigh[:] for v, neigh in L.items()}
+
+
+def _pack_edge(a: int, b: int) -> int:
+    """Aresta {a, b} entre ids inteiros como um único int canônico (menor id
+    nos 32 bits altos): hash e comparação de int em vez de tupla."""
+    return (a << 32) | b if a < b else (b << 32) | a
+
+
+def _bfs_levels(
+    indptr: array,
+    indices: array,
+    sources: Iterable[int],
+    parent: Optional[List[int]] = None,
+) -> Iterator[List[int]]:
+    """
+    BFS síncrona por níveis sobre o CSR: gera a fronteira de cada nível (a
+    primeira é *sources*, sem repetições). Cada fronteira nova é montada a
+    partir da anterior, sem fila nem pop(0); a ordem de descoberta é a mesma
+    de uma BFS com fila FIFO. Se *parent* for dado, parent[w] recebe o id que
+    descobriu w.
+    """
+    seen = bytearray(len(indptr) - 1)
+    frontier = []
+    for s in sources:
+        if not seen[s]:
+            seen[s] = 1
+            frontier.append(s)
+    while frontier:
+        yield frontier
+        nxt: List[int] = []
+        for u in frontier:
+            for w in indices[indptr[u] : indptr[u + 1]]:
+                if not seen[w]:
+                    seen[w] = 1
+                    if parent is not None:
+                        parent[w] = u
+                    nxt.append(w)
+        frontier = nxt
+
+
+def _bfs_distances(nbrs: List[Tuple[int, ...]], source: int) -> List[int]:
+    """
+    Distância (em arestas) de *source* a cada id; -1 se inalcançável. *nbrs*
+    são as tuplas de _nbr_ids. O próprio vetor de distâncias marca os
+    visitados (-1 = não visto): sem bytearray à parte, sem gerador e sem
+    fatiar o CSR a cada vértice, o laço interno é só índice e comparação.
+    """
+    dist = [-1] * len(nbrs)
+    dist[source] = 0
+    frontier = [source]
+    d = 0
+    while frontier:
+        d += 1
+        nxt: List[int] = []
+        for u in frontier:
+            for w in nbrs[u]:
+                if dist[w] < 0:
+                    dist[w] = d
+                    nxt.append(w)
+        frontier = nxt
+    return dist
+
+
+# Parâmetros da BFS com otimização de direção (Beamer et al.): passa a
+# bottom-up quando as arestas da fronteira superam 1/α das arestas ainda não
+# visitadas, e volta a top-down quando a fronteira cai abaixo de n/β.
+_BFS_ALPHA = 14
+_BFS_BETA = 24
+# Acima de tantas arestas na fronteira, o passo top-down usa chain + set
+_BFS_SET_STEP = 32
+
+
+def _bfs_levels_diropt(
+    nbrs: List[Tuple[int, ...]], deg: List[int], sources: Iterable[int]
+) -> Iterator[List[int]]:
+    """
+    Como _bfs_levels (sem *parent*), mas com otimização de direção: em
+    fronteiras densas cada vértice não visitado procura um vizinho na
+    fronteira e para no primeiro (bottom-up), em vez de a fronteira empurrar
+    todas as suas arestas. Os níveis são os mesmos; a ordem dentro de um
+    nível pode não ser a da fila. Para quem só usa distâncias. *nbrs* e
+    *deg* são os vizinhos e o grau de cada id (_nbr_ids, _degree_seq).
+
+    No passo top-down com fronteira grande, os vizinhos são juntados por
+    chain + set em C; o laço Python fica só com os vértices novos (O(V) em
+    vez de O(E) por BFS).
+    """
+    n = len(deg)
+    seen = bytearray(n)
+    frontier = []
+    for s in sources:
+        if not seen[s]:
+            seen[s] = 1
+            frontier.append(s)
+    m_f = sum(map(deg.__getitem__, frontier))  # arestas da fronteira
+    m_u = sum(deg) - m_f  # arestas dos ainda não visitados
+    n_u = n - len(frontier)
+    rest: Optional[List[int]] = None  # candidatos do passo bottom-up
+    bottom_up = False
+    while frontier:
+        yield frontier
+        if bottom_up:
+            bottom_up = len(frontier) * _BFS_BETA >= n
+        else:
+            # Além da regra de α: o passo bottom-up visita cada não visitado,
+            # então a fronteira precisa ter mais arestas do que isso (em
+            # árvores e grades a regra de α sozinha só atrasa a busca).
+            bottom_up = m_f * _BFS_ALPHA > m_u and m_f > n_u + m_u // _BFS_ALPHA
+        if bottom_up:
+            nxt: List[int] = []
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            if rest is None:
+                rest = [w for w in range(n) if not seen[w]]
+            still = []
+            for w in rest:
+                if seen[w]:
+                    continue
+                for u in nbrs[w]:
+                    if in_frontier[u]:
+                        seen[w] = 1
+                        nxt.append(w)
+                        break
+                else:
+                    still.append(w)
+            rest = still
+        elif m_f > _BFS_SET_STEP:
+            nxt = [w for w in set(chain.from_iterable(map(nbrs.__getitem__, frontier))) if not seen[w]]
+            for w in nxt:
+                seen[w] = 1
+        else:
+            nxt = []
+            for u in frontier:
+                for w in nbrs[u]:
+                    if not seen[w]:
+                        seen[w] = 1
+                        nxt.append(w)
+        m_f = sum(map(deg.__getitem__, nxt))
+        m_u -= m_f
+        n_u -= len(nxt)
+        frontier = nxt
+
+
+def _bfs_meet(
+    indptr: array,
+    indices: array,
+    deg: List[int],
+    sources: Iterable[int],
+    targets: Iterable[int],
+    par_f: Optional[List[int]] = None,
+    par_b: Optional[List[int]] = None,
+) -> Optional[Tuple[int, int, List[int], List[int]]]:
+    """
+    BFS bidirecional entre os conjuntos de ids *sources* e *targets*: a cada
+    rodada expande um nível inteiro do lado cuja fronteira tem menos arestas
+    (alternância gulosa). Retorna (w, d, dist_f, dist_b), com w o primeiro
+    vértice alcançado pelos dois lados e d = dist_f[w] + dist_b[w] a menor
+    distância, ou None se os conjuntos estão em componentes distintas.
+
+    O primeiro encontro já é ótimo: antes dele as bolas de raio k (fonte) e
+    L (alvo) são disjuntas, logo d ≥ k + L + 1, e todo encontro na expansão
+    de um nível vale exatamente isso. *par_f*/*par_b*, se dados, recebem o
+    pai de cada id em cada lado, para reconstruir o caminho.
+    """
+    n = len(deg)
+    dist_f = [-1] * n
+    dist_b = [-1] * n
+    F: List[int] = []
+    B: List[int] = []
+    for s in sources:
+        if dist_f[s] < 0:
+            dist_f[s] = 0
+            F.append(s)
+    for t in targets:
+        if dist_f[t] == 0:
+            return t, 0, dist_f, dist_b
+        if dist_b[t] < 0:
+            dist_b[t] = 0
+            B.append(t)
+    c_f = sum(map(deg.__getitem__, F))
+    c_b = sum(map(deg.__getitem__, B))
+    while F and B:
+        forward = c_f <= c_b
+        if forward:
+            frontier, dist, other, parent = F, dist_f, dist_b, par_f
+        else:
+            frontier, dist, other, parent = B, dist_b, dist_f, par_b
+        nxt: List[int] = []
+        for u in frontier:
+            d = dist[u] + 1
+            for w in indices[indptr[u] : indptr[u + 1]]:
+                if dist[w] < 0:
+                    dist[w] = d
+                    if parent is not None:
+                        parent[w] = u
+                    if other[w] >= 0:
+                        return w, d + other[w], dist_f, dist_b
+                    nxt.append(w)
+        if forward:
+            F, c_f = nxt, sum(map(deg.__getitem__, nxt))
+        else:
+            B, c_b = nxt, sum(map(deg.__getitem__, nxt))
+    return None
+
+
+def _iter_bits(x: int) -> Iterator[int]:
+    """Posições dos bits ligados de *x*, do menos para o mais significativo."""
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+
+def _forest_from_bits(
+    bits: int, ends: List[Tuple[int, int]], n: int
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Floresta das arestas ligadas em *bits* (ids de aresta; ends[i] são as
+    pontas da aresta i): pai, aresta até o pai e profundidade de cada um dos
+    *n* ids de vértice, enraizando cada árvore no menor id que ela contém.
+    """
+    tree_adj: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+    for i in _iter_bits(bits):
+        a, b = ends[i]
+        tree_adj[a].append((b, i))
+        tree_adj[b].append((a, i))
+    parent = [-1] * n
+    pedge = [-1] * n
+    depth = [-1] * n
+    for root in range(n):
+        if depth[root] >= 0:
+            continue
+        depth[root] = 0
+        queue = [root]
+        for u in queue:
+            d = depth[u] + 1
+            for w, i in tree_adj[u]:
+                if depth[w] < 0:
+                    depth[w] = d
+                    parent[w] = u
+                    pedge[w] = i
+                    queue.append(w)
+    return parent, pedge, depth
+
+
+def _tree_path_edge_ids(
+    parent: List[int], pedge: List[int], depth: List[int], u: int, v: int
+) -> Optional[List[int]]:
+    """
+    Ids das arestas do caminho u … v na floresta de _forest_from_bits: sobe
+    pelo lado mais fundo até igualar as profundidades e depois pelos dois
+    até o ancestral comum. None se u e v estão em árvores distintas.
+    """
+    left: List[int] = []
+    right: List[int] = []
+    while depth[u] > depth[v]:
+        left.append(pedge[u])
+        u = parent[u]
+    while depth[v] > depth[u]:
+        right.append(pedge[v])
+        v = parent[v]
+    while u != v:
+        if not depth[u]:  # duas raízes distintas
+            return None
+        left.append(pedge[u])
+        right.append(pedge[v])
+        u, v = parent[u], parent[v]
+    right.reverse()
+    return left + right
+
+
+# Fontes por lote na BFS bit-paralela (bits por inteiro de _ecc_bitparallel)
+_ECC_BLOCK = 4096
+
+
+def _ecc_bitparallel(indptr: array, indices: array, lo: int, hi: int) -> Tuple[List[int], int]:
+    """
+    Excentricidades das fontes lo…hi-1 numa única BFS em lote: reach[v] é um
+    int usado como bitset, com o bit s−lo ligado quando a fonte s já alcançou
+    v. A cada nível, reach[v] |= OR de reach[w] dos vizinhos (um só OR de
+    ints em C cobre todas as fontes), recalculado apenas para vértices com
+    algum vizinho alterado no nível anterior.
+
+    Retorna (ecc, covered): ecc[s−lo] é o último nível em que a fonte s
+    alcançou vértice novo, isto é, a maior distância dentro da componente; o
+    bit s−lo de covered diz se s alcançou todos os vértices.
+    """
+    n = len(indptr) - 1
+    reach = [0] * n
+    for s in range(lo, hi):
+        reach[s] = 1 << (s - lo)
+    grew: List[int] = []  # grew[L-1] = fontes que avançaram no nível L
+    dirty: Iterable[int] = range(n)
+    while True:
+        new = {}
+        for v in dirty:
+            acc = functools.reduce(or_, map(reach.__getitem__, indices[indptr[v] : indptr[v + 1]]), reach[v])
+            if acc != reach[v]:
+                new[v] = acc
+        if not new:
+            break
+        level = 0
+        touched = bytearray(n)
+        for v, acc in new.items():
+            level |= acc ^ reach[v]
+            reach[v] = acc
+            for w in indices[indptr[v] : indptr[v + 1]]:
+                touched[w] = 1
+        grew.append(level)
+        dirty = list(compress(range(n), touched))
+    # O último nível em que cada fonte aparece é a sua excentricidade
+    ecc = [0] * (hi - lo)
+    pending = (1 << (hi - lo)) - 1
+    for L in range(len(grew), 0, -1):
+        hit = grew[L - 1] & pending
+        pending ^= hit
+        while hit:
+            low = hit & -hit
+            ecc[low.bit_length() - 1] = L
+            hit ^= low
+    return ecc, functools.reduce(and_, reach, (1 << (hi - lo)) - 1)
+
+
+# Estados da DFS com cores (bytearray por id), em cycle_containing
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+
+# Até este número de vértices, has_hamiltonian_cycle decide por DP em bitmask
+_HAMILTON_DP_MAX_N = 12
+
+
+@functools.lru_cache(maxsize=256)
+def _hamiltonian_mask_dp(masks: Tuple[int, ...]) -> bool:
+    """
+    Decide se há ciclo Hamiltoniano por programação dinâmica em bitmask
+    (Held–Karp), em O(2ⁿ·n) no pior caso, sem o pior caso fatorial do
+    backtracking. masks[v] tem o bit w ligado se v–w é aresta.
+
+    dp[S] é a máscara dos vértices v tais que algum caminho começando no
+    vértice 0 cobre exatamente S e termina em v (só S contendo 0 importa).
+
+    Memorizado pela tupla de máscaras: consultas repetidas sobre a mesma
+    estrutura (mesmos ids, ex.: cópias do grafo ou lotes de testes) são O(1).
+    """
+    n = len(masks)
+    full = (1 << n) - 1
+    dp = [0] * (1 << n)
+    dp[1] = 1
+    for S in range(1, full, 2):
+        ends = dp[S]
+        if not ends:
+            continue
+        reach = 0  # vizinhos de qualquer ponta alcançável em S
+        while ends:
+            low = ends & -ends
+            ends ^= low
+            reach |= masks[low.bit_length() - 1]
+        nxt = reach & ~S
+        while nxt:
+            b = nxt & -nxt
+            nxt ^= b
+            dp[S | b] |= b
+    return bool(dp[full] & masks[0])
+
+
+def _prune_forced_edges(nbrs: List[List[int]]) -> Optional[List[List[int]]]:
+    """
+    Poda de arestas forçadas (Vandegriend) antes da busca Hamiltoniana.
+
+    As duas arestas de um vértice de grau 2 estão em todo ciclo Hamiltoniano
+    (são *forçadas*). Repete até estabilizar:
+      • um vértice com 2 arestas forçadas perde as demais;
+      • a corda que fecharia um caminho forçado maximal (antes de cobrir
+        todos os vértices) é removida.
+    Retorna as listas de vizinhos podadas (ordem preservada) ou None se ficar
+    provado que não há ciclo: grau < 2, mais de 2 arestas forçadas num vértice
+    ou um ciclo forçado que não cobre o grafo.
+    """
+    n = len(nbrs)
+    if n < 3:
+        return nbrs
+    nb = [set(neigh) for neigh in nbrs]
+    changed = True
+    while changed:
+        changed = False
+        if any(len(s) < 2 for s in nb):
+            return None
+        forced: List[Set[int]] = [set() for _ in range(n)]
+        for v, s in enumerate(nb):
+            if len(s) == 2:
+                for w in s:
+                    forced[v].add(w)
+                    forced[w].add(v)
+        for v, f in enumerate(forced):
+            if len(f) > 2:
+                return None
+            if len(f) == 2 and len(nb[v]) > 2:
+                for w in nb[v] - f:
+                    nb[w].discard(v)
+                nb[v] = set(f)
+                changed = True
+        if changed:
+            continue
+        # Caminhos forçados maximais: percorre a partir das pontas (grau forçado 1)
+        seen = bytearray(n)
+        for a in range(n):
+            if len(forced[a]) != 1 or seen[a]:
+                continue
+            prev, cur, size = -1, a, 1
+            seen[a] = 1
+            while True:
+                nxt = [w for w in forced[cur] if w != prev]
+                if not nxt:
+                    break
+                prev, cur = cur, nxt[0]
+                seen[cur] = 1
+                size += 1
+            if size < n and cur in nb[a] and cur not in forced[a]:
+                nb[a].discard(cur)
+                nb[cur].discard(a)
+                changed = True
+        # Sobrou componente forçado sem pontas: é um ciclo – só vale se cobrir tudo
+        for v in range(n):
+            if forced[v] and not seen[v]:
+                size, prev, cur = 0, -1, v
+                while not seen[cur]:
+                    seen[cur] = 1
+                    size += 1
+                    prev, cur = cur, next(w for w in forced[cur] if w != prev)
+                if size < n:
+                    return None
+    return [[w for w in neigh if w in nb[v]] for v, neigh in enumerate(nbrs)]
+
+
 class Graph:
     """Grafo simples, não direcionado, sem laços nem paralelas."""
 
@@ -31,71 +510,321 @@ class Graph:
     # ------------------------------------------------------------------ #
     def __init__(
         self,
-        vertices: Optional[Set[Vertex]] = None,
-        edges: Optional[Set[Edge]] = None,
+        vertices: Optional[Iterable[Vertex]] = None,
+        edges: Optional[Iterable[Edge]] = None,
     ) -> None:
+        """*edges* pode ser qualquer iterável (inclusive gerador): as arestas são
+        inseridas uma a uma, sem exigir um conjunto intermediário."""
         self.V: Set[Vertex] = set(vertices) if vertices else set()
         self.E: Set[Edge] = set()
+        # adj fica em listas (ordem de inserção, que fixa os ids do CSR e a
+        # ordem das travessias); pertinência de aresta é consultada em E.
         self.adj: Dict[Vertex, List[Vertex]] = {v: [] for v in self.V}
+        # Contador de mutações: valores memorizados (_memo) valem para um _epoch
+        self._epoch = 0
+        self._memo: Dict[str, Tuple[int, Any]] = {}
 
         if edges:
-            for u, v in edges:
-                self.add_edge(u, v)
+            self._add_edges(edges)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Edge]) -> "Graph":
+        """Grafo com as arestas de *edges* (pares em qualquer ordem; duplicatas
+        são ignoradas), inseridas em lote por _add_edges."""
+        g = cls()
+        g._add_edges(edges)
+        return g
+
+    def _add_edges(self, edges: Iterable[Edge]) -> None:
+        """
+        Equivale a add_edge(u, v) para cada par, na mesma ordem (e com o mesmo
+        erro para laços), mas num único laço local: sem chamada de método nem
+        add_vertex por aresta.
+        """
+        V, E, adj = self.V, self.E, self.adj
+        for u, v in edges:
+            if u == v:
+                raise ValueError("Laços não são permitidos em grafos simples (u == v).")
+            e = (u, v) if u <= v else (v, u)
+            if e in E:
+                continue
+            E.add(e)
+            if u not in adj:
+                V.add(u)
+                adj[u] = []
+            if v not in adj:
+                V.add(v)
+                adj[v] = []
+            adj[u].append(v)
+            adj[v].append(u)
+        self._epoch += 1
+
+    @classmethod
+    def _from_canonical(cls, V: Set[Vertex], E: Set[Edge]) -> "Graph":
+        """
+        Monta um grafo a partir de arestas já canônicas (u < v) cujas pontas
+        estão todas em *V* – caso dos resultados de operações de conjunto.
+        Preenche V/E/adj direto, sem as verificações de add_edge; a ordem de
+        inserção é a mesma de ``Graph(vertices=V, edges=E)``.
+        """
+        g = cls()
+        g.V = V
+        g.E = E
+        adj = g.adj = {v: [] for v in V}
+        for u, v in E:
+            adj[u].append(v)
+            adj[v].append(u)
+        return g
+
+    def copy(self) -> "Graph":
+        """
+        Cópia independente do grafo, sem copy.deepcopy: rótulos são imutáveis,
+        então basta copiar os contêineres (V, E e cada lista de adj). O
+        cache (_memo) vem junto com o mesmo _epoch: os valores memorizados
+        valem para a cópia até a primeira mutação dela.
+        """
+        g = type(self)()
+        g.V = set(self.V)
+        g.E = set(self.E)
+        g.adj = {v: neigh[:] for v, neigh in self.adj.items()}
+        g._epoch = self._epoch
+        g._memo = dict(self._memo)
+        return g
+
+    __copy__ = copy
 
     def add_vertex(self, v: Vertex) -> None:
         if v not in self.V:
             self.V.add(v)
             self.adj[v] = []
+            self._epoch += 1
 
     def add_edge(self, u: Vertex, v: Vertex) -> None:
         if u == v:
             raise ValueError("Laços não são permitidos em grafos simples (u == v).")
         self.add_vertex(u)
         self.add_vertex(v)
-        e = (min(u, v), max(u, v))  # representação canônica
+        e = (u, v) if u <= v else (v, u)  # representação canônica
         if e not in self.E:
             self.E.add(e)
             self.adj[u].append(v)
             self.adj[v].append(u)
+            self._epoch += 1
+
+    # ------------------------------------------------------------------ #
+    # Índice inteiro (CSR)                                               #
+    # ------------------------------------------------------------------ #
+    @_cached_on_epoch()
+    def _csr(self) -> _CSR:
+        """Índice CSR do grafo, reconstruído apenas após alguma mutação."""
+        labels = list(self.adj)
+        idx = {v: i for i, v in enumerate(labels)}
+        # array('i'): 4 bytes por entrada, contíguos (uma lista guarda um
+        # ponteiro de 8 bytes para cada int)
+        indptr = array("i", [0])
+        indices = array("i")
+        for neigh in self.adj.values():
+            indices.extend(map(idx.__getitem__, neigh))
+            indptr.append(len(indices))
+        return _CSR(labels, idx, indptr, indices)
+
+    @_cached_on_epoch()
+    def _nbr_ids(self) -> List[Tuple[int, ...]]:
+        """Vizinhos de cada id do CSR como tupla, materializados uma vez:
+        iterar uma tupla pronta é mais barato que fatiar indices a cada
+        visita, e map/chain conseguem percorrê-las em C. Não alterar."""
+        _, _, indptr, indices = self._csr()
+        # Fatiar uma lista é mais barato que fatiar o array; map monta as
+        # tuplas em C, sem laço Python por vértice
+        flat = indices.tolist()
+        return list(map(tuple, map(flat.__getitem__, map(slice, indptr, indptr[1:]))))
+
+    @_cached_on_epoch()
+    def _sorted_csr(self) -> _CSR:
+        """Mesmos ids de _csr, mas cada fatia de vizinhos em ordem de rótulo
+        (a ordem de _sorted_adj), para travessias cujo resultado depende dela."""
+        labels, idx, indptr, _ = self._csr()
+        sorted_adj = self._sorted_adj()
+        indices = array("i")
+        for v in labels:
+            indices.extend(map(idx.__getitem__, sorted_adj[v]))
+        return _CSR(labels, idx, indptr, indices)
+
+    @_cached_on_epoch()
+    def _rcm_csr(self) -> _CSR:
+        """
+        CSR com os ids renumerados por Reverse Cuthill–McKee: em cada
+        componente, BFS a partir de um vértice pseudo-periférico, com os
+        vizinhos de cada vértice enfileirados por grau crescente, e a ordem
+        final invertida. Vizinhos passam a ter ids próximos (banda pequena),
+        então as fatias de indices e os vetores indexados por id são
+        percorridos com mais localidade. labels/idx seguem a nova numeração.
+
+        Custa uma passada O(V + E log Δ); só vale para travessias pesadas
+        (várias BFS), por isso é montado sob demanda e memorizado.
+
+        Agrupar antes os hubs (ids por grau decrescente, RCM no resto) não
+        compensou: em CPython cada acesso já passa por objetos int no heap, e
+        a diferença medida ficou dentro do ruído.
+        """
+        labels, _, indptr, indices = self._csr()
+        deg = self._degree_seq()
+        n = len(labels)
+        placed = bytearray(n)
+        order: List[int] = []
+        for seed in sorted(range(n), key=deg.__getitem__):
+            if placed[seed]:
+                continue
+            # Pseudo-periférico: desce ao último nível e recomeça de lá (o de
+            # menor grau) enquanto a excentricidade crescer
+            root, depth = seed, -1
+            while True:
+                levels = list(_bfs_levels(indptr, indices, (root,)))
+                if len(levels) - 1 <= depth:
+                    break
+                depth = len(levels) - 1
+                root = min(levels[-1], key=deg.__getitem__)
+            placed[root] = 1
+            head = len(order)
+            order.append(root)
+            while head < len(order):  # Cuthill–McKee: a fila é a própria ordem
+                u = order[head]
+                head += 1
+                fresh = [w for w in indices[indptr[u] : indptr[u + 1]] if not placed[w]]
+                fresh.sort(key=deg.__getitem__)
+                for w in fresh:
+                    placed[w] = 1
+                order.extend(fresh)
+        order.reverse()
+
+        new_id = [0] * n
+        for i, u in enumerate(order):
+            new_id[u] = i
+        new_labels = [labels[u] for u in order]
+        new_indptr = array("i", [0])
+        new_indices = array("i")
+        for u in order:
+            new_indices.extend(map(new_id.__getitem__, indices[indptr[u] : indptr[u + 1]]))
+            new_indptr.append(len(new_indices))
+        return _CSR(new_labels, {v: i for i, v in enumerate(new_labels)}, new_indptr, new_indices)
 
     # ------------------------------------------------------------------ #
     # Conversões de representação                                        #
     # ------------------------------------------------------------------ #
-    def adjacency_matrix(self) -> List[List[int]]:
-        index = {v: i for i, v in enumerate(sorted(self.V))}
+    @_cached_on_epoch()
+    def _V_sorted(self) -> List[Vertex]:
+        """V em ordem de rótulo (ordem das linhas das matrizes). Não alterar."""
+        return sorted(self.V)
+
+    @_cached_on_epoch()
+    def _E_sorted(self) -> List[Edge]:
+        """E em ordem lexicográfica (ordem das colunas da incidência). Não alterar."""
+        return sorted(self.E)
+
+    @_cached_on_epoch()
+    def _edge_ends(self) -> Tuple["array[int]", "array[int]"]:
+        """
+        Arestas em estrutura de arrays: src[k] e dst[k] são as linhas (posições
+        em _V_sorted) das pontas da k-ésima aresta de _E_sorted (a coluna k da
+        incidência). Os rótulos são traduzidos uma vez, em C (map sobre o
+        índice); depois só se percorrem pares de ints. Uso interno: não alterar.
+        """
+        index = {v: i for i, v in enumerate(self._V_sorted())}
+        E_sorted = self._E_sorted()
+        src = array("i", map(index.__getitem__, map(itemgetter(0), E_sorted)))
+        dst = array("i", map(index.__getitem__, map(itemgetter(1), E_sorted)))
+        return src, dst
+
+    @_cached_on_epoch()
+    def _adjacency_bytes(self) -> List[bytearray]:
+        """Matriz de adjacência com 1 byte por célula (linhas bytearray), na
+        ordem de _V_sorted: é o que fica no cache. Uso interno: não alterar."""
+        # Aqui a ordem das arestas não importa: percorre E direto, sem pagar a
+        # ordenação de _E_sorted que _edge_ends exige.
+        index = {v: i for i, v in enumerate(self._V_sorted())}
         n = len(self.V)
-        M = [[0] * n for _ in range(n)]
+        M = [bytearray(n) for _ in range(n)]
         for u, v in self.E:
             i, j = index[u], index[v]
             M[i][j] = M[j][i] = 1
         return M
 
+    def adjacency_matrix(self) -> List[List[int]]:
+        # list(bytearray) converte cada linha em C: a cópia entregue ao
+        # chamador sai mais barata que copiar listas de int já prontas.
+        return [list(row) for row in self._adjacency_bytes()]
+
     @classmethod
     def from_adjacency_matrix(
         cls, M: List[List[int]], labels: Optional[List[Vertex]] = None
     ) -> "Graph":
         n = len(M)
         if labels is None:
-            labels = [str(i) for i in range(n)]
+            # Internados: grafos lidos de matrizes distintas compartilham os
+            # mesmos objetos str, e comparar suas arestas para na identidade.
+            labels = [sys.intern(str(i)) for i in range(n)]
         if len(labels) != n:
             raise ValueError("Número de rótulos deve coincidir com tamanho da matriz.")
         g = cls()
-        for i in range(n):
-            for j in range(i + 1, n):
-                if M[i][j]:
-                    g.add_edge(labels[i], labels[j])
+        if len(set(labels)) != n:  # rótulos repetidos: add_edge trata laços/duplicatas
+            for i, row in enumerate(M):
+                u = labels[i]
+                for j in compress(range(i + 1, n), row[i + 1 :]):
+                    g.add_edge(u, labels[j])
+            return g
+
+        # Rótulos distintos: cada par (i < j) do triângulo superior é uma aresta
+        # nova e nunca um laço, então as estruturas são preenchidas direto, sem
+        # as verificações de add_edge (mesma ordem de inserção em V/adj).
+        V, E, adj = g.V, g.E, g.adj
+        for i, row in enumerate(M):
+            # compress filtra as posições não nulas em C
+            js = list(compress(range(i + 1, n), row[i + 1 :]))
+            if not js:
+                continue
+            u = labels[i]
+            if u not in adj:
+                V.add(u)
+                adj[u] = []
+            adj_u = adj[u]
+            for j in js:
+                v = labels[j]
+                if v not in adj:
+                    V.add(v)
+                    adj[v] = [u]
+                else:
+                    adj[v].append(u)
+                adj_u.append(v)
+                E.add((u, v) if u <= v else (v, u))
         return g
 
-    def incidence_matrix(self) -> List[List[int]]:
-        V_sorted = sorted(self.V)
-        E_sorted = sorted(self.E)
-        idx_v = {v: i for i, v in enumerate(V_sorted)}
-        M = [[0] * len(E_sorted) for _ in range(len(V_sorted))]
-        for e_idx, (u, v) in enumerate(E_sorted):
-            M[idx_v[u]][e_idx] = 1
-            M[idx_v[v]][e_idx] = 1
+    @_cached_on_epoch()
+    def _incidence_bytes(self) -> List[bytearray]:
+        """Matriz de incidência em linhas bytearray (linhas na ordem de
+        _V_sorted, colunas na de _E_sorted). Uso interno: não alterar."""
+        src, dst = self._edge_ends()
+        m = len(src)
+        M = [bytearray(m) for _ in range(len(self.V))]
+        for e, i, j in zip(range(m), src, dst):
+            M[i][e] = M[j][e] = 1
         return M
 
+    def incidence_matrix(self) -> List[List[int]]:
+        return [list(row) for row in self._incidence_bytes()]
+
+    def iter_incidence(self) -> Iterator[Tuple[Vertex, List[int]]]:
+        """
+        Incidência esparsa, uma linha por vez: pares (v, colunas das arestas
+        incidentes em v), com linhas e colunas na ordem de incidence_matrix.
+        Memória O(V + E), sem as |V|·|E| células da matriz densa.
+        """
+        src, dst = self._edge_ends()
+        rows: List[List[int]] = [[] for _ in range(len(self.V))]
+        for e, i, j in zip(range(len(src)), src, dst):
+            rows[i].append(e)
+            rows[j].append(e)
+        return zip(self._V_sorted(), rows)
+
     @classmethod
     def from_incidence_matrix(
         cls, M: List[List[int]], labels: Optional[List[Vertex]] = None
@@ -103,25 +832,40 @@ class Graph:
         n = len(M)
         m = len(M[0]) if n else 0
         if labels is None:
-            labels = [str(i) for i in range(n)]
-        g = cls()
-        for e in range(m):
-            verts = [labels[v] for v in range(n) if M[v][e] == 1]
-            if len(verts) != 2:
+            labels = [sys.intern(str(i)) for i in range(n)]
+        if any(len(row) != m for row in M):
+            raise ValueError("Matriz de incidência não retangular.")
+        # Uma passada por linha, sem transpor a matriz: compress acha em C as
+        # arestas em que o vértice v incide. Entradas não nulas diferentes de 1
+        # invalidam a matriz; depois, cada coluna precisa de duas pontas.
+        ends: List[List[int]] = [[] for _ in range(m)]
+        for v, row in enumerate(M):
+            incident = list(compress(range(m), row))
+            if row.count(1) != len(incident):
                 raise ValueError("Matriz de incidência inválida para grafo simples.")
-            g.add_edge(verts[0], verts[1])
-        return g
+            for e in incident:
+                ends[e].append(v)
+        if any(len(pair) != 2 for pair in ends):
+            raise ValueError("Matriz de incidência inválida para grafo simples.")
+        return cls.from_edges((labels[a], labels[b]) for a, b in ends)
+
+    @_cached_on_epoch()
+    def _sorted_adj(self) -> Dict[Vertex, List[Vertex]]:
+        """Vizinhos de cada vértice em ordem de rótulo, ordenados uma única vez
+        por estado do grafo. Uso interno: não alterar as listas."""
+        return {v: sorted(neigh) for v, neigh in self.adj.items()}
+
+    def iter_adjacency(self) -> Iterator[Tuple[Vertex, List[Vertex]]]:
+        """Pares (v, vizinhos ordenados) gerados sob demanda, um por vez."""
+        for v, neigh in self._sorted_adj().items():
+            yield v, neigh[:]
 
     def adjacency_list(self) -> Dict[Vertex, List[Vertex]]:
-        return {v: sorted(neigh) for v, neigh in self.adj.items()}
+        return _copy_lists(self._sorted_adj())
 
     @classmethod
     def from_adjacency_list(cls, L: Dict[Vertex, List[Vertex]]) -> "Graph":
-        g = cls()
-        for u, neighs in L.items():
-            for v in neighs:
-                g.add_edge(u, v)
-        return g
+        return cls.from_edges((u, v) for u, neighs in L.items() for v in neighs)
 
     # ------------------------------------------------------------------ #
     # Métricas e consultas básicas                                       #
@@ -134,78 +878,106 @@ class Graph:
 
     def neighbors(self, v: Vertex) -> List[Vertex]:
         self._ensure_vertex(v)
-        return sorted(self.adj[v])
+        return self._sorted_adj()[v][:]
 
     def are_adjacent(self, u: Vertex, v: Vertex) -> bool:
         self._ensure_vertex(u)
         self._ensure_vertex(v)
-        return v in self.adj[u]
+        # consulta O(1) em E, em vez de varrer a lista adj[u]
+        return ((u, v) if u <= v else (v, u)) in self.E
 
     def degree(self, v: Vertex) -> int:
         self._ensure_vertex(v)
         return len(self.adj[v])
 
+    @_cached_on_epoch(dict)
     def degrees(self) -> Dict[Vertex, int]:
         return {v: len(neigh) for v, neigh in self.adj.items()}
 
     # ------------------------------------------------------------------ #
-    # Caminho simples (DFS)                                              #
+    # Caminho simples (BFS bidirecional)                                 #
     # ------------------------------------------------------------------ #
     def simple_path(self, start: Vertex, goal: Vertex) -> Optional[List[Vertex]]:
+        """Um caminho simples de *start* a *goal* (o mais curto, ver
+        shortest_path), ou None se não houver."""
+        return self.shortest_path(start, goal)
+
+    def shortest_path(self, start: Vertex, goal: Vertex) -> Optional[List[Vertex]]:
+        """Caminho com o menor número de arestas de *start* a *goal*, ou None.
+        Usa BFS bidirecional: explora ~O(b^(d/2)) vértices em vez de O(b^d)."""
         self._ensure_vertex(start)
         self._ensure_vertex(goal)
-        visited: Set[Vertex] = set()
-        path: List[Vertex] = []
-
-        def dfs(u: Vertex) -> bool:
-            visited.add(u)
+        if start == goal:
+            return [start]
+        labels, idx, indptr, indices = self._csr()
+        n = len(labels)
+        par_f = [-1] * n
+        par_b = [-1] * n
+        hit = _bfs_meet(
+            indptr, indices, self._degree_seq(), (idx[start],), (idx[goal],), par_f, par_b
+        )
+        if hit is None:
+            return None
+        w, _, dist_f, dist_b = hit
+        # Cada lado sobe pelos seus pais a partir do ponto de encontro
+        path = [w]
+        u = w
+        while dist_f[u]:
+            u = par_f[u]
             path.append(u)
-            if u == goal:
-                return True
-            for w in self.adj[u]:
-                if w not in visited and dfs(w):
-                    return True
-            path.pop()
-            return False
-
-        if dfs(start):
-            return path
-        return None
+        path.reverse()
+        u = w
+        while dist_b[u]:
+            u = par_b[u]
+            path.append(u)
+        return [labels[i] for i in path]
 
     # ------------------------------------------------------------------ #
     # Ciclo contendo um vértice (DFS)                                    #
     # ------------------------------------------------------------------ #
     def cycle_containing(self, v: Vertex) -> Optional[List[Vertex]]:
         self._ensure_vertex(v)
-        parent: Dict[Vertex, Vertex] = {}
-        visited: Set[Vertex] = set()
-
-        def dfs(u: Vertex, p: Optional[Vertex]) -> Optional[List[Vertex]]:
-            visited.add(u)
-            for w in self.adj[u]:
-                if w == p:
+        labels, idx, indptr, indices = self._csr()
+        # Três cores por id: branco (não visto), cinza (na pilha da DFS),
+        # preto (concluído). Só aresta para cinza fecha ciclo.
+        color = bytearray(len(labels))  # _WHITE
+        pos = [0] * len(labels)  # pos[u] = posição de u em path (se cinza)
+        s = idx[v]
+        color[s] = _GRAY
+        # path é o caminho raiz → topo da DFS; its[k] itera os vizinhos de
+        # path[k], e o pai de path[k] é path[k - 1].
+        path = [s]
+        its = [iter(indices[indptr[s] : indptr[s + 1]])]
+        while its:
+            u = path[-1]
+            p = path[-2] if len(path) > 1 else -1
+            for w in its[-1]:
+                c = color[w]
+                if w == p or c == _BLACK:
                     continue
-                if w in visited:
-                    # monta ciclo
-                    cycle = [w, u]
-                    x = u
-                    while x != w:
-                        x = parent[x]
-                        cycle.append(x)
-                    cycle.reverse()
-                    return cycle
-                parent[w] = u
-                c = dfs(w, u)
-                if c:
-                    return c
-            return None
-
-        return dfs(v, None)
+                if c == _GRAY:
+                    # Aresta de retorno: w é ancestral de u, então o ciclo é o
+                    # trecho w … u do caminho atual (fechado de volta em w).
+                    cycle = path[pos[w] :]
+                    cycle.append(w)
+                    return [labels[i] for i in cycle]
+                color[w] = _GRAY
+                pos[w] = len(path)
+                path.append(w)
+                its.append(iter(indices[indptr[w] : indptr[w + 1]]))
+                break
+            else:
+                its.pop()
+                color[path.pop()] = _BLACK
+        return None
 
     # ------------------------------------------------------------------ #
     # Subgrafo                                                           #
     # ------------------------------------------------------------------ #
     def is_subgraph_of(self, other: "Graph") -> bool:
+        # Contagens primeiro: O(1), e rejeitam sem hashing o caso negativo comum
+        if len(self.V) > len(other.V) or len(self.E) > len(other.E):
+            return False
         return self.V.issubset(other.V) and self.E.issubset(other.E)
 
     # ------------------------------------------------------------------ #
@@ -215,8 +987,15 @@ class Graph:
         if v not in self.V:
             raise ValueError(f"Vértice '{v}' não pertence ao grafo.")
 
+    def _ensure_vertices(self, vs: Set[Vertex]) -> None:
+        """Valida um conjunto inteiro com um único issubset em C; só percorre
+        *vs* (para achar o culpado) quando algum vértice falta."""
+        if not vs <= self.V:
+            for v in vs:
+                self._ensure_vertex(v)
+
     def __str__(self) -> str:  # pragma: no cover
-        return f"Graph(V={sorted(self.V)}, E={sorted(self.E)})"
+        return f"Graph(V={self._V_sorted()}, E={self._E_sorted()})"
 
     __repr__ = __str__
 
@@ -224,23 +1003,23 @@ class Graph:
         """Retorna um *novo* grafo G = self ∪ other (união de vértices e arestas)."""
         V = self.V.union(other.V)
         E = self.E.union(other.E)
-        return Graph(vertices=V, edges=E)
+        return Graph._from_canonical(V, E)
 
     def intersection(self, other: "Graph") -> "Graph":
         """Retorna um *novo* grafo contendo apenas vértices e arestas presentes em ambos."""
         V_common = self.V.intersection(other.V)
-        # Mantém somente arestas que aparecem em ambos *e* cujos vértices estão no conjunto comum
-        E_common = {e for e in self.E.intersection(other.E) if e[0] in V_common and e[1] in V_common}
-        return Graph(vertices=V_common, edges=E_common)
+        # Uma aresta comum tem as pontas em self.V e em other.V, logo em V_common
+        # (sem vértices em comum, não há aresta comum a procurar)
+        E_common = self.E.intersection(other.E) if V_common else set()
+        return Graph._from_canonical(V_common, E_common)
 
     def symmetric_difference(self, other: "Graph") -> "Graph":
         """Retorna um *novo* grafo com a diferença simétrica (arestas em exatamente um dos grafos)."""
+        # Toda aresta de self.E ou other.E tem as pontas em self.V ∪ other.V:
+        # não é preciso varrer E atrás de vértices faltando.
         V = self.V.union(other.V)
         E = self.E.symmetric_difference(other.E)
-        # Garante inclusão de vértices incidentes às arestas resultantes
-        verts_in_edges = {v for edge in E for v in edge}
-        V.update(verts_in_edges)
-        return Graph(vertices=V, edges=E)
+        return Graph._from_canonical(V, E)
 
     # ------------------------------------------------------------------ #
     #  Transformações que removem / fundem elementos                     #
@@ -250,173 +1029,282 @@ class Graph:
         self._ensure_vertex(v)
         V = self.V - {v}
         E = {e for e in self.E if v not in e}
-        return Graph(vertices=V, edges=E)
+        return Graph._from_canonical(V, E)
 
     def without_edge(self, u: Vertex, v: Vertex) -> "Graph":
         """Retorna um *novo* grafo sem a aresta (u, v)."""
         self._ensure_vertex(u)
         self._ensure_vertex(v)
-        e = (min(u, v), max(u, v))
+        e = (u, v) if u <= v else (v, u)
         if e not in self.E:
             raise ValueError(f"Aresta {e} não pertence ao grafo.")
         E = self.E - {e}
-        return Graph(vertices=set(self.V), edges=E)
+        return Graph._from_canonical(set(self.V), E)
 
     def merge_vertices(self, v1: Vertex, v2: Vertex) -> "Graph":
         """Funde *v1* e *v2* num único vértice (mantém o rótulo de v1)."""
         self._ensure_vertex(v1)
         self._ensure_vertex(v2)
         new_V = self.V - {v2}
-        new_edges: Set[Edge] = set()
-        for a, b in self.E:
-            a_new = v1 if a in {v1, v2} else a
-            b_new = v1 if b in {v1, v2} else b
-            if a_new == b_new:
-                continue  # evita laço
-            new_edges.add((min(a_new, b_new), max(a_new, b_new)))
-        return Graph(vertices=new_V, edges=new_edges)
+        # Só as arestas de v2 mudam: saem (diferença de conjuntos em C) e
+        # voltam redirecionadas para v1, exceto a própria v1–v2 (seria laço).
+        # Custo em Python O(grau(v2)), não O(|E|).
+        incident = self.adj[v2]
+        new_edges = self.E.difference([(v2, w) if v2 <= w else (w, v2) for w in incident])
+        new_edges.update([(v1, w) if v1 <= w else (w, v1) for w in incident if w != v1])
+        return Graph._from_canonical(new_V, new_edges)
 
     # ------------------------------------------------------------------ #
     #  Conectividade / Euler / Hamilton                                #
     # ------------------------------------------------------------------ #
+    @_cached_on_epoch()
+    def _degree_seq(self) -> List[int]:
+        """Grau de cada id do CSR: diferenças consecutivas de indptr, calculadas
+        uma vez por estado do grafo."""
+        indptr = self._csr().indptr
+        return list(map(sub, indptr[1:], indptr))
+
     def _non_isolated_vertices(self) -> Set[Vertex]:
         """Conjunto de vértices com grau > 0."""
-        return {v for v, neigh in self.adj.items() if neigh}
+        return set(compress(self._csr().labels, self._degree_seq()))
 
+    @_cached_on_epoch()
     def is_connected(self) -> bool:
         """Verifica se o grafo é conectado (ignorando vértices isolados)."""
-        if not self.V:
-            return True
-        non_iso = self._non_isolated_vertices()
-        if not non_iso:
+        # DFS sobre ids do CSR; visited é um bytearray (1 byte por vértice,
+        # sem hashing de rótulos). Conexo ⇔ alcança todos os não isolados.
+        labels, _, indptr, indices = self._csr()
+        deg = self._degree_seq()
+        active = len(labels) - deg.count(0)
+        if not active:
             return True  # sem arestas → considera conectado
-        start = next(iter(non_iso))
-        visited: Set[Vertex] = set()
+        start = next(compress(range(len(labels)), deg))
+        visited = bytearray(len(labels))
+        visited[start] = 1
+        reached = 1
         stack = [start]
         while stack:
             u = stack.pop()
-            if u in visited:
-                continue
-            visited.add(u)
-            stack.extend([w for w in self.adj[u] if w not in visited])
-        return visited == non_iso
+            for w in indices[indptr[u] : indptr[u + 1]]:
+                if not visited[w]:
+                    visited[w] = 1
+                    reached += 1
+                    stack.append(w)
+        return reached == active
 
     def is_eulerian(self) -> bool:
         """Retorna True se o grafo possuir circuito Euleriano."""
-        if not self.is_connected():
+        # Paridade primeiro: basta um vértice de grau ímpar, e o teste roda em C
+        # sobre a sequência de graus (isolados têm grau 0, par), sem nenhuma busca.
+        if any(map((1).__and__, self._degree_seq())):
             return False
-        return all(len(self.adj[v]) % 2 == 0 for v in self._non_isolated_vertices())
+        return self.is_connected()
+
+    def eulerian_circuit(self) -> Optional[List[Vertex]]:
+        """Circuito Euleriano via Hierholzer, em O(V + E).
+
+        Retorna a sequência de vértices (o primeiro se repete no fim), [] se o
+        grafo não tem arestas, ou None se o grafo não for Euleriano.
+        """
+        if not self.is_eulerian():
+            return None
+        if not self.E:
+            return []
+        labels, idx, indptr, indices = self._csr()
+        # Id da aresta em cada posição de indices (cada aresta aparece duas vezes)
+        eid: Dict[int, int] = {}
+        edge_of: List[int] = []
+        for u in range(len(labels)):
+            for w in indices[indptr[u] : indptr[u + 1]]:
+                edge_of.append(eid.setdefault(_pack_edge(u, w), len(eid)))
+        used = bytearray(len(eid))
+        ptr = indptr[:-1]  # próxima posição a examinar em cada vértice
+
+        stack = [idx[min(self._non_isolated_vertices())]]
+        circuit: List[int] = []
+        while stack:
+            u = stack[-1]
+            k, end = ptr[u], indptr[u + 1]
+            while k < end and used[edge_of[k]]:
+                k += 1
+            if k < end:
+                used[edge_of[k]] = 1
+                ptr[u] = k + 1
+                stack.append(indices[k])
+            else:
+                ptr[u] = k
+                circuit.append(stack.pop())
+        circuit.reverse()
+        return [labels[i] for i in circuit]
 
     def hamiltonian_cycle(self) -> Optional[List[Vertex]]:
         """Tenta encontrar um ciclo Hamiltoniano.  Retorna lista de vértices (com repetição do primeiro no fim) ou None."""
         n = len(self.V)
         if n == 0:
             return []
-        start = sorted(self.V)[0]
-        path: List[Vertex] = [start]
-        visited: Set[Vertex] = {start}
-
-        def backtrack(u: Vertex) -> bool:
-            if len(path) == n:
-                if start in self.adj[u]:
-                    path.append(start)
-                    return True
-                return False
-            for w in sorted(self.adj[u]):
-                if w not in visited:
-                    visited.add(w)
-                    path.append(w)
-                    if backtrack(w):
-                        return True
-                    visited.remove(w)
-                    path.pop()
-            return False
-
-        if backtrack(start):
-            return path
+        if 3 <= n <= _HAMILTON_DP_MAX_N and not self.has_hamiltonian_cycle():
+            # A DP decide "não" em O(2ⁿ·n); sem ela, provar a inexistência
+            # custaria o backtracking exaustivo, o pior caso da busca.
+            return None
+        labels, idx, indptr, indices = self._sorted_csr()
+        start = idx[self._V_sorted()[0]]
+        # Vizinhos em ordem de rótulo (desempate da ordem de Warnsdorff), já
+        # ordenados uma vez no _sorted_csr memorizado
+        nbrs = _prune_forced_edges([indices[indptr[u] : indptr[u + 1]].tolist() for u in range(n)])
+        if nbrs is None:  # a poda já provou que não há ciclo
+            return None
+        closes = bytearray(n)  # closes[w] = 1 se w é vizinho de start
+        for w in nbrs[start]:
+            closes[w] = 1
+
+        # free[w] = vizinhos de w ainda fora do caminho. Ordem de Warnsdorff:
+        # tenta primeiro o vizinho com menos saídas livres (empate: rótulo),
+        # que é o mais arriscado de deixar para depois.
+        in_path = bytearray(n)
+        free = [len(neigh) for neigh in nbrs]
+
+        def enter(w: int) -> bool:
+            """Põe w no caminho; False se deixou algum vizinho sem saída."""
+            in_path[w] = 1
+            stuck = False
+            for x in nbrs[w]:
+                free[x] -= 1
+                if not free[x] and not in_path[x]:
+                    stuck = True
+            # Vizinho fora do caminho sem saídas livres só pode ser o último
+            return not stuck or len(path) == n - 1
+
+        def leave(w: int) -> None:
+            in_path[w] = 0
+            for x in nbrs[w]:
+                free[x] += 1
+
+        def candidates(u: int) -> Iterator[int]:
+            options = [w for w in nbrs[u] if not in_path[w]]
+            options.sort(key=free.__getitem__)
+            return iter(options)
+
+        # Backtracking iterativo: pilha explícita de iteradores de vizinhos,
+        # sem um frame Python por nível nem limite de recursão.
+        path = [start]
+        enter(start)
+        stack = [candidates(start)]
+        while stack:
+            if len(path) < n:
+                for w in stack[-1]:
+                    if not in_path[w]:
+                        path.append(w)
+                        # Beco sem saída: pilha vazia para w, retrocede já
+                        stack.append(candidates(w) if enter(w) else iter(()))
+                        break
+                else:  # vizinhos esgotados: retrocede
+                    stack.pop()
+                    leave(path.pop())
+            elif closes[path[-1]]:
+                return [labels[i] for i in path] + [labels[start]]
+            else:
+                stack.pop()
+                leave(path.pop())
         return None
 
     def has_hamiltonian_cycle(self) -> bool:
-        """Atalho booleano para existência de ciclo Hamiltoniano."""
-        return self.hamiltonian_cycle() is not None
+        """Atalho booleano para existência de ciclo Hamiltoniano.
+
+        Para 3 ≤ n ≤ _HAMILTON_DP_MAX_N decide por DP em bitmask, com custo
+        limitado independentemente da forma do grafo; fora disso (e em K₁/K₂,
+        casos degenerados do backtracking) usa hamiltonian_cycle.
+        """
+        n = len(self.V)
+        if not 3 <= n <= _HAMILTON_DP_MAX_N:
+            return self.hamiltonian_cycle() is not None
+        _, _, indptr, indices = self._csr()
+        masks = tuple(sum(1 << w for w in indices[indptr[u] : indptr[u + 1]]) for u in range(n))
+        return _hamiltonian_mask_dp(masks)
 
     # ------------------------------------------------------------------ #
     #  Árvores                                                           #
     # ------------------------------------------------------------------ #
     
+    @_cached_on_epoch()
     def is_tree(self) -> bool:
         if not self.V: # Grafo vazio não é árvore
             return False
         
         # Um grafo com n vértices é uma árvore se for conectado e tiver n-1 arestas.
-        is_conn = self.is_connected()
-        has_correct_edges = self.num_edges() == self.num_vertices() - 1
-        
-        return is_conn and has_correct_edges
+        # A contagem é O(1) e descarta a maioria dos não-árvores antes da DFS.
+        if self.num_edges() != self.num_vertices() - 1:
+            return False
+        return self.is_connected()
 
+    @_cached_on_epoch(list)
     def find_centers(self) -> List[Vertex]:
         if not self.is_tree():
             raise ValueError("O grafo não é uma árvore. Centros são definidos apenas para árvores.")
 
-        g_copy = copy.deepcopy(self)
-        
-        n = g_copy.num_vertices()
+        n = len(self.V)
         if n <= 2:
-            return sorted(list(g_copy.V))
-
-        leaves = {v for v in g_copy.V if g_copy.degree(v) == 1}
-
-        while n > 2:
-            n -= len(leaves)
-            
-            # Remove as folhas atuais
-            next_leaves = set()
+            return self._V_sorted()  # o cache de find_centers já entrega uma cópia
+
+        # Poda de folhas por níveis sobre um vetor de graus: remover uma folha
+        # é zerar o seu grau e decrementar o do único vizinho ainda vivo, sem
+        # copiar nem reconstruir o grafo. O(V + E) no total.
+        labels, _, indptr, indices = self._csr()
+        deg = self._degree_seq()[:]
+        removed = bytearray(n)
+        leaves = [u for u in range(n) if deg[u] == 1]
+        remaining = n
+        while remaining > 2 and leaves:
+            remaining -= len(leaves)
+            next_leaves = []
             for leaf in leaves:
-                # O único vizinho da folha
-                neighbor = g_copy.adj[leaf][0]
-                
-                # Remove a folha do grafo (e arestas incidentes)
-                g_copy = g_copy.without_vertex(leaf)
-
-                # Se o vizinho se tornou uma nova folha, adiciona à lista da próxima iteração
-                if g_copy.degree(neighbor) == 1:
-                    next_leaves.add(neighbor)
-            
+                removed[leaf] = 1
+                deg[leaf] = 0
+                for w in indices[indptr[leaf] : indptr[leaf + 1]]:
+                    if deg[w]:  # o vizinho que ainda não saiu
+                        deg[w] -= 1
+                        # Se o vizinho se tornou folha, entra no próximo nível
+                        if deg[w] == 1:
+                            next_leaves.append(w)
+                        break
             leaves = next_leaves
 
-        return sorted(list(g_copy.V))
+        return sorted(labels[u] for u in range(n) if not removed[u])
 
     def vertex_eccentricities(self) -> Dict[Vertex, int]:
         """Calcula a excentricidade de cada vértice da árvore."""
         if not self.is_tree():
             raise ValueError("A excentricidade está definida apenas para árvores.")
 
-        def bfs(start: Vertex) -> Dict[Vertex, int]:
-            visited = {start}
-            queue = [(start, 0)]
-            dist = {start: 0}
-            while queue:
-                u, d = queue.pop(0)
-                for v in self.adj[u]:
-                    if v not in visited:
-                        visited.add(v)
-                        dist[v] = d + 1
-                        queue.append((v, d + 1))
-            return dist
-
-        ecc = {}
-        for v in self.V:
-            distancias = bfs(v)
-            ecc[v] = max(distancias.values())
-        return ecc
+        idx, ecc = self._tree_eccentricity_seq()
+        return {v: ecc[idx[v]] for v in self.V}
+
+    @_cached_on_epoch()
+    def _tree_eccentricity_seq(self) -> Tuple[Dict[Vertex, int], List[int]]:
+        """
+        (idx, ecc) de uma árvore por varredura dupla, com três BFS em vez de
+        uma por vértice: da BFS a partir do id 0 sai a ponta *a* mais
+        distante; de *a*, a outra ponta *b* de um diâmetro. Numa árvore o
+        vértice mais distante de qualquer v é *a* ou *b*, logo
+        ecc[v] = max(dist_a[v], dist_b[v]). Uso interno: não alterar.
+        """
+        idx = self._csr().idx
+        nbrs = self._nbr_ids()
+        dist = _bfs_distances(nbrs, 0)
+        if -1 in dist:
+            # is_tree ignora isolados: ciclo + isolados passa no teste, e aí
+            # a varredura dupla não vale – usa o cálculo geral
+            idx, ecc, _ = self._eccentricity_seq()
+            return idx, ecc
+        dist_a = _bfs_distances(nbrs, dist.index(max(dist)))
+        dist_b = _bfs_distances(nbrs, dist_a.index(max(dist_a)))
+        return idx, list(map(max, dist_a, dist_b))
 
     def radius(self) -> int:
         """Retorna o raio da árvore: a menor excentricidade entre os vértices."""
         if not self.is_tree():
             raise ValueError("O raio está definido apenas para árvores.")
-        
-        ecc = self.vertex_eccentricities()
-        return min(ecc.values())
+
+        return min(self._tree_eccentricity_seq()[1])
 
     # ------------------------------------------------------------------ #
     #  Exercício 7 – Árvore de Abrangência                               #
@@ -428,21 +1316,14 @@ class Graph:
             raise ValueError("O grafo precisa ser conectado para possuir árvore de abrangência.")
 
         if start is None:
-            start = sorted(self.V)[0] 
-
-        visited: Set[Vertex] = {start}
-        queue: List[Vertex] = [start]
-        tree_edges: Set[Edge] = set()
-
-        while queue:
-            u = queue.pop(0)
-            for v in sorted(self.adj[u]): 
-                if v not in visited:
-                    visited.add(v)
-                    queue.append(v)
-                    tree_edges.add((min(u, v), max(u, v)))
+            start = self._V_sorted()[0]
 
-        return Graph(vertices=self.V.copy(), edges=tree_edges)
+        # BFS sobre os ids de _sorted_csr: mesma ordem de visita (vizinhos por
+        # rótulo) e, portanto, a mesma árvore
+        labels, idx, indptr, indices = self._sorted_csr()
+        return Graph._from_canonical(
+            self.V.copy(), self._bfs_tree_edges(labels, indptr, indices, idx[start])
+        )
 
     def fundamental_cycle(self, edge: Edge) -> list[Edge]:
         cycle_vertices = self.cycle_containing(edge[0])
@@ -453,38 +1334,54 @@ class Graph:
         for i in range(len(cycle_vertices)):
             u = cycle_vertices[i]
             w = cycle_vertices[(i + 1) % len(cycle_vertices)]  
-            edges.append((min(u, w), max(u, w)))
+            edges.append((u, w) if u <= w else (w, u))
 
         return edges
     
     def k_spanning_trees(self, base_tree: Graph, k: int) -> list[Graph]:
-        seen = set()
+        """Até *k* árvores de abrangência distintas de *base_tree*, obtidas por
+        trocas de arestas (busca em largura a partir de base_tree).
+
+        As arestas de G são numeradas na ordem de _E_sorted e cada árvore é um
+        int usado como vetor de bits sobre elas: a troca T + e − f são dois
+        XORs, e *seen* guarda ints em vez de frozensets de tuplas. O ciclo
+        fundamental de e = (u, v) é o caminho u … v na árvore (via pai e
+        profundidade) mais e. Só as árvores devolvidas viram Graph.
+        """
+        if not base_tree.E <= self.E:
+            raise ValueError("A árvore base deve ser subgrafo de G.")
+        edges = self._E_sorted()
+        idx = self._csr().idx
+        ends = [(idx[a], idx[b]) for a, b in edges]
+        bit_of = {e: i for i, e in enumerate(edges)}
+        all_edges = (1 << len(edges)) - 1
+
+        start = 0
+        for e in base_tree.E:
+            start |= 1 << bit_of[e]
+        seen = {start}
         results = []
-        queue = []
-        
-        queue.append(base_tree)
-        seen.add(frozenset(base_tree.E))
+        queue = deque([start])
 
         while queue and len(results) < k:
-            current = queue.pop(0)
-            current_edges = set(current.E)
-            non_tree_edges = self.E - current_edges
-
-            for e in non_tree_edges:
-                extended_edges = current_edges | {e}
-                temp_graph = Graph(vertices=self.V, edges=extended_edges)
-                cycle = temp_graph.fundamental_cycle(e)
-                
+            tree = queue.popleft()
+            parent, pedge, depth = _forest_from_bits(tree, ends, len(idx))
+
+            for e in _iter_bits(all_edges & ~tree):
+                cycle = _tree_path_edge_ids(parent, pedge, depth, *ends[e])
+                if cycle is None:  # pontas em árvores distintas da floresta
+                    continue
+                extended = tree | (1 << e)
                 for f in cycle:
-                    if f == e:
-                        continue
-                    new_edges = extended_edges - {f}
-                    new_tree = Graph(vertices=self.V, edges=new_edges)
-                    key = frozenset(new_tree.E)
+                    key = extended ^ (1 << f)
                     if key not in seen:
                         seen.add(key)
-                        results.append(new_tree)
-                        queue.append(new_tree)
+                        results.append(
+                            Graph._from_canonical(
+                                set(self.V), {edges[i] for i in _iter_bits(key)}
+                            )
+                        )
+                        queue.append(key)
                         if len(results) == k:
                             return results
         return results
@@ -498,22 +1395,13 @@ class Graph:
         Se não existir caminho retorna None."""
         if not S1 or not S2:
             return None
-        # BFS multi-origem a partir de S1
-        visited: Dict[Vertex, int] = {}
-        queue: List[Vertex] = []
-        for v in S1:
-            self._ensure_vertex(v)
-            visited[v] = 0
-            queue.append(v)
-        while queue:
-            u = queue.pop(0)
-            if u in S2:
-                return visited[u]
-            for w in self.adj[u]:
-                if w not in visited:
-                    visited[w] = visited[u] + 1
-                    queue.append(w)
-        return None  # conjuntos desconexos
+        # BFS bidirecional multi-origem: S1 de um lado, S2 do outro
+        self._ensure_vertices(S1)
+        _, idx, indptr, indices = self._csr()
+        sources = [idx[v] for v in S1]
+        targets = [idx[v] for v in S2 if v in idx]
+        hit = _bfs_meet(indptr, indices, self._degree_seq(), sources, targets)
+        return None if hit is None else hit[1]  # None: conjuntos desconexos
 
     def distance_between_trees(self, A1: "Graph", A2: "Graph") -> Optional[int]:
         """Calcula a menor distância entre as árvores A1 e A2 consideradas subgrafos de G.
@@ -534,21 +1422,52 @@ class Graph:
         if not self.is_connected():
             raise ValueError("O grafo deve ser conectado para calcular excentricidades.")
 
-        def bfs(source: Vertex) -> int:
-            dist: Dict[Vertex, int] = {source: 0}
-            queue: List[Vertex] = [source]
-            while queue:
-                u = queue.pop(0)
-                for w in self.adj[u]:
-                    if w not in dist:
-                        dist[w] = dist[u] + 1
-                        queue.append(w)
-            if len(dist) != len(self.V):
-                # Grafo desconexo (não deveria acontecer após verificação)
-                return float("inf")
-            return max(dist.values())
-
-        return {v: bfs(v) for v in self.V}
+        idx, ecc, spans = self._eccentricity_seq()
+        # Fonte que não alcança todos: grafo desconexo (não deveria acontecer
+        # após verificação)
+        return {v: ecc[idx[v]] if spans[idx[v]] else float("inf") for v in self.V}
+
+    @_cached_on_epoch()
+    def _eccentricity_seq(self) -> Tuple[Dict[Vertex, int], List[int], bytearray]:
+        """
+        (idx, ecc, spans): para cada id de *idx*, a maior distância dentro da
+        componente e 1 se alcança todos os vértices. Escolhe entre a BFS
+        bit-paralela em lotes e uma BFS por fonte estimando o diâmetro com uma
+        BFS a partir do id 0: a bit-paralela custa ~um OR por aresta por nível
+        (≈ diâmetro níveis), e só perde em grafos longos como caminhos.
+
+        A bit-paralela corre sobre _rcm_csr: fontes de um lote ficam próximas
+        no grafo, a onda de cada nível é mais localizada e menos vértices são
+        recalculados (~2× numa grade 100×200 com rótulos embaralhados).
+        Memorizado: radius, vertex_eccentricities e central_tree reaproveitam o
+        mesmo cálculo. Uso interno: não alterar.
+        """
+        _, idx, indptr, indices = self._csr()
+        n = len(idx)
+        ecc: List[int] = []
+        spans = bytearray(n)
+        if not n:
+            return idx, ecc, spans
+        probe = sum(1 for _ in _bfs_levels(indptr, indices, (0,))) - 1
+        if probe * 4 < n:
+            _, idx, indptr, indices = self._rcm_csr()
+            for lo in range(0, n, _ECC_BLOCK):
+                hi = min(lo + _ECC_BLOCK, n)
+                block, covered = _ecc_bitparallel(indptr, indices, lo, hi)
+                ecc.extend(block)
+                for s in range(lo, hi):
+                    spans[s] = covered >> (s - lo) & 1
+            return idx, ecc, spans
+        nbrs = self._nbr_ids()
+        deg = self._degree_seq()
+        for s in range(n):
+            levels = reached = 0
+            for frontier in _bfs_levels_diropt(nbrs, deg, (s,)):
+                levels += 1
+                reached += len(frontier)
+            ecc.append(levels - 1)
+            spans[s] = reached == n
+        return idx, ecc, spans
 
     def central_tree(self) -> "Graph":
         """Gera uma *árvore central* de G: uma árvore geradora de altura mínima.
@@ -559,22 +1478,28 @@ class Graph:
         ecc = self._eccentricities_general()
         min_ecc = min(ecc.values())
         centers = [v for v, e in ecc.items() if e == min_ecc]
-        root = sorted(centers)[0]  # escolha determinística
+        root = min(centers)  # escolha determinística, sem ordenar a lista
 
         # BFS para construir árvore
+        labels, idx, indptr, indices = self._csr()
+        return Graph._from_canonical(
+            set(self.V), self._bfs_tree_edges(labels, indptr, indices, idx[root])
+        )
+
+    @staticmethod
+    def _bfs_tree_edges(
+        labels: List[Vertex], indptr: array, indices: array, root: int
+    ) -> Set[Edge]:
+        """Arestas (canônicas) da árvore de BFS enraizada no id *root*."""
+        parent = [-1] * len(labels)
         tree_edges: Set[Edge] = set()
-        visited: Set[Vertex] = {root}
-        queue: List[Vertex] = [root]
-        parent: Dict[Vertex, Vertex] = {}
-        while queue:
-            u = queue.pop(0)
-            for w in self.adj[u]:
-                if w not in visited:
-                    visited.add(w)
-                    parent[w] = u
-                    tree_edges.add((min(u, w), max(u, w)))
-                    queue.append(w)
-        return Graph(vertices=set(self.V), edges=tree_edges)
+        for frontier in _bfs_levels(indptr, indices, (root,), parent):
+            for w in frontier:
+                p = parent[w]
+                if p >= 0:
+                    a, b = labels[p], labels[w]
+                    tree_edges.add((a, b) if a <= b else (b, a))
+        return tree_edges
 
     def is_subgraph_tree(self, tree_a1: "Graph") -> bool:
         # Verifica se 'tree_a1' é um subgrafo.
@@ -0,0 +1,33 @@
+"""tests/test_cli.py – Testes do modo não interativo do cli.py.
+
+Para executar:
+    pytest -q tests/test_cli.py
+"""
+
+import cli
+
+
+def test_read_edges_stops_at_blank_line():
+    lines = ["A B\n", "B C\n", "lixo\n", "C A\n", "\n", "X Y\n"]
+    assert cli._read_edges(iter(lines)) == {("A", "B"), ("B", "C"), ("A", "C")}
+
+
+def test_query_path_from_edges_file(tmp_path, capsys):
+    f = tmp_path / "edges.txt"
+    f.write_text("A B\nB C\nC D\n")
+    cli.main(["--edges", str(f), "--query", "path", "--u", "A", "--v", "D"])
+    assert capsys.readouterr().out == "Caminho: ['A', 'B', 'C', 'D']\n"
+
+
+def test_query_neighbors_from_adjacency_csv(tmp_path, capsys):
+    f = tmp_path / "adj.csv"
+    f.write_text("0,1,1\n1,0,0\n1,0,0\n")
+    cli.main(["--adj", str(f), "--query", "neighbors", "--u", "1"])
+    assert capsys.readouterr().out == "Adjacentes: ['2', '3']\n"
+
+
+def test_script_replays_menu_answers(capsys):
+    cli.main(["--script", "1,1,A B,B C,,,3,2,,0,0"])
+    out = capsys.readouterr().out
+    assert "|E| = 2" in out
+    assert out.rstrip().endswith("Até logo!")
@@ -0,0 +1,27 @@
+"""tests/test_csv_loader.py – Testes do leitor de CSVs da pasta ./files.
+
+Para executar:
+    pytest -q tests/test_csv_loader.py
+"""
+
+import pytest
+
+import csv_loader
+
+
+def test_safe_path_rejects_sibling_with_same_prefix(tmp_path, monkeypatch):
+    base = tmp_path / "files"
+    base.mkdir()
+    evil = tmp_path / "files_evil"
+    evil.mkdir()
+    (evil / "g.csv").write_text("0,1\n1,0\n")
+    monkeypatch.setattr(csv_loader, "BASE_DIR", base)
+    with pytest.raises(ValueError):
+        csv_loader.read_matrix("../files_evil/g.csv")
+
+
+def test_parse_adj_list_from_stream():
+    import io
+
+    buf = io.StringIO("A;B;C;B\n\nB;A\n")
+    assert csv_loader._parse_adj_list(buf, ";") == {"A": ["B", "C"], "B": ["A"]}
@@ -126,4 +126,44 @@ def test_hamiltonian_cycle(square_graph: Graph):
     cycle = g.hamiltonian_cycle()
     assert cycle is not None
     assert cycle[0] == cycle[-1]  # ciclo fechado
-    assert set(cycle[:-1]) == g.V  # cobre todos vértices
\ No newline at end of file
+    assert set(cycle[:-1]) == g.V  # cobre todos vértices
+
+def test_iter_adjacency_matches_adjacency_list(square_graph: Graph):
+    assert dict(square_graph.iter_adjacency()) == square_graph.adjacency_list()
+
+
+def test_iter_incidence_matches_incidence_matrix(square_graph: Graph):
+    M = square_graph.incidence_matrix()
+    for i, (v, cols) in enumerate(square_graph.iter_incidence()):
+        assert v == sorted(square_graph.V)[i]
+        assert cols == [e for e, bit in enumerate(M[i]) if bit]
+
+
+def test_cached_representations_follow_mutations(square_graph: Graph):
+    L = square_graph.adjacency_list()
+    L["A"].append("X")  # alterar o resultado não afeta o grafo
+    assert square_graph.adjacency_list()["A"] == ["B", "C"]
+    square_graph.add_edge("A", "D")
+    assert square_graph.adjacency_list()["A"] == ["B", "C", "D"]
+    assert square_graph.degrees()["A"] == 3
+
+
+def test_cached_predicates_follow_mutations():
+    g = Graph(edges=[("A", "B"), ("B", "C")])
+    assert g.is_tree() and g.find_centers() == ["B"]
+    g.find_centers().append("X")  # cópia: não corrompe o cache
+    assert g.find_centers() == ["B"]
+    g.add_edge("C", "D")
+    assert g.is_tree() and g.find_centers() == ["B", "C"]
+    g.add_edge("D", "A")
+    assert not g.is_tree() and g.is_connected()
+    g.add_edge("E", "F")
+    assert not g.is_connected()
+
+
+def test_copy_is_independent(square_graph: Graph):
+    c = square_graph.copy()
+    assert (c.V, c.E, c.adjacency_list()) == (square_graph.V, square_graph.E, square_graph.adjacency_list())
+    c.add_edge("A", "D")
+    assert ("A", "D") in c.E and ("A", "D") not in square_graph.E
+    assert square_graph.degrees()["A"] == 2 and c.degrees()["A"] == 3
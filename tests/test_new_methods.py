@@ -4,6 +4,8 @@ Para executar:
     pytest -q tests/test_new_methods.py
 """
 
+import pytest
+
 from graph import Graph
 
 
@@ -107,4 +109,61 @@ def test_hamiltonian_cycle_presence():
     g1 = square_graph()
     assert g1.has_hamiltonian_cycle() is True
     g2 = path_graph()
-    assert g2.has_hamiltonian_cycle() is False 
\ No newline at end of file
+    assert g2.has_hamiltonian_cycle() is False 
+
+def test_long_path_does_not_hit_recursion_limit():
+    n = 5000
+    g = Graph(edges=[(f"{i:04d}", f"{i + 1:04d}") for i in range(n)])
+    assert len(g.simple_path("0000", f"{n:04d}")) == n + 1
+    g.add_edge("0000", f"{n:04d}")
+    assert len(g.cycle_containing("0000")) == n + 2
+    assert g.is_connected()
+
+
+def test_eulerian_circuit():
+    g = G({"A": ["B", "C", "D", "E"], "B": ["C"], "D": ["E"]})  # duas "gravatas"
+    circuit = g.eulerian_circuit()
+    assert circuit[0] == circuit[-1] == "A"
+    walked = {tuple(sorted(p)) for p in zip(circuit, circuit[1:])}
+    assert len(circuit) - 1 == g.num_edges() and walked == g.E
+    assert path_graph().eulerian_circuit() is None
+
+
+def test_from_edges_matches_add_edge():
+    pairs = [("B", "A"), ("A", "B"), ("C", "B"), ("A", "C")]
+    g = Graph.from_edges(iter(pairs))
+    assert g.E == {("A", "B"), ("B", "C"), ("A", "C")}
+    assert g.adjacency_list() == {"A": ["B", "C"], "B": ["A", "C"], "C": ["A", "B"]}
+    with pytest.raises(ValueError):
+        Graph.from_edges([("A", "A")])  # laço
+
+
+def test_eccentricities_on_dense_graph():
+    # K(20, 180): a partir de um lado, o 2º nível já é achado em bottom-up
+    A = [f"a{i:02d}" for i in range(20)]
+    B = [f"b{i:03d}" for i in range(180)]
+    g = Graph(edges=[(a, b) for a in A for b in B])
+    assert set(g._eccentricities_general().values()) == {2}
+    assert g.distance_between_trees(Graph(["a00"]), Graph(["a19"])) == 2
+    assert g.distance_between_trees(Graph(["a00"]), Graph(["b000"])) == 1
+
+
+def test_shortest_path_is_bidirectional_bfs():
+    # Ciclo de 8 com atalho 0–4: o caminho mais curto de 1 a 5 usa o atalho
+    g = Graph(edges=[(str(i), str((i + 1) % 8)) for i in range(8)] + [("0", "4")])
+    path = g.shortest_path("1", "5")
+    assert len(path) == 4 and path[0] == "1" and path[-1] == "5"
+    assert all(g.are_adjacent(a, b) for a, b in zip(path, path[1:]))
+    assert g.simple_path("3", "3") == ["3"]
+    g.add_vertex("x")
+    assert g.shortest_path("1", "x") is None
+
+
+def test_k_spanning_trees_are_distinct_spanning_trees():
+    # Triângulo A-B-C com cauda C-D: exatamente 3 árvores de abrangência
+    g = G({"A": ["B", "C"], "B": ["C"], "C": ["D"]})
+    base = g.find_spanning_tree()
+    trees = g.k_spanning_trees(base, 10)
+    assert len(trees) == 2
+    assert all(g.is_spanning_tree(t) and t.E != base.E for t in trees)
+    assert len({frozenset(t.E) for t in trees}) == 2